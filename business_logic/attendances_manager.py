@@ -17,20 +17,45 @@
 
 import eventlet
 from .operation_manager import OperationManager
-import configparser
 import string
-from .models.attendance import Attendance
+from .models.attendance import Attendance, three_months_before
 from .models.device import Device
 from .shared_state import SharedState
 from ..utils.errors import BaseError
-from ..utils.file_manager import create_folder_and_return_path, find_root_directory
-config = configparser.ConfigParser()
+from ..utils.file_manager import create_folder_and_return_path, find_root_directory, load_config
 from datetime import datetime
+import gzip
+import locale
 import os
-lock = eventlet.semaphore.Semaphore()
 
-# Define the transformation mapping
-config.read(os.path.join(find_root_directory(), 'config.ini'))
+# Folder where a backup of the device attendance files is kept
+BACKUP_DEVICES_PATH: str = r"C:\\ProgramData\\Gestor Reloj de Asistencias Backup\\devices"
+
+# Date format used in the device attendance file names
+DATE_FORMAT: str = "%Y-%m-%d"
+
+# Number of attendances formatted between cooperative yields
+FORMAT_YIELD_INTERVAL: int = 1000
+
+# Number of semaphores that guard the writes to the attendance files
+FILE_LOCK_STRIPES: int = 64
+
+# Fixed set of semaphores shared by hashing the file path, so devices writing to different files rarely
+# block each other and the set does not grow with the dated file names
+file_locks: tuple[eventlet.semaphore.Semaphore, ...] = tuple(eventlet.semaphore.Semaphore() for _ in range(FILE_LOCK_STRIPES))
+
+def get_file_lock(file: str):
+    """
+    Returns the semaphore that guards writes to the given file.
+
+    Args:
+        file (str): The path of the file to be written.
+
+    Returns:
+        (eventlet.semaphore.Semaphore): The semaphore assigned to the resolved file path. The same path
+            always maps to the same semaphore.
+    """
+    return file_locks[hash(os.path.abspath(file)) % FILE_LOCK_STRIPES]
 
 class AttendancesManagerBase(OperationManager):
     def __init__(self, state: SharedState):
@@ -43,13 +68,18 @@ class AttendancesManagerBase(OperationManager):
         Attributes:
             attendances_count_devices (dict[str, dict[str, str]]): A dictionary to track attendance counts for devices.
             name_attendances_file (str): The name of the attendances file, retrieved from the 'Program_config' section of the configuration.
+            date_string (str): The date used to name the device files, computed once per batch.
+            compress_attendances (bool): Whether the global attendances file is stored gzip-compressed, retrieved
+                from the optional 'compress_attendances' key of the 'Program_config' section.
 
         Calls:
             super().__init__(state): Initializes the parent class with the provided shared state.
         """
         self.attendances_count_devices: dict[str, dict[str, str]] = {}
         # Get the value of name_attendances_file from the [Program_config] section
-        self.name_attendances_file: str = config['Program_config']['name_attendances_file']
+        self.name_attendances_file: str = load_config()['Program_config']['name_attendances_file']
+        self.compress_attendances: bool = load_config().getboolean('Program_config', 'compress_attendances', fallback=False)
+        self.date_string: str = None
         super().__init__(state)
 
     def manage_devices_attendances(self, selected_ips: list[str]):
@@ -69,6 +99,7 @@ class AttendancesManagerBase(OperationManager):
             (dict): A dictionary containing the attendance count for each device.
         """
         self.attendances_count_devices.clear()
+        self.date_string = datetime.today().strftime(DATE_FORMAT)
         super().manage_threads_to_devices(selected_ips=selected_ips, function=self.manage_attendances_of_one_device)
         return self.attendances_count_devices
     
@@ -103,19 +134,23 @@ class AttendancesManagerBase(OperationManager):
                 - attendance_with_error (list[Attendance]): The list of Attendance objects 
                   that are either older than three months or in the future.
         """
-        attendances_post_formatting: list[Attendance] = []
-        attendance_with_error = []
-        for attendance in attendances:
+        attendances_post_formatting: list[Attendance] = list(attendances)
+        attendance_with_error: list[Attendance] = []
+        # Compute the valid date range once instead of once per attendance
+        now: datetime = datetime.now()
+        three_months_ago: datetime = three_months_before(now)
+        for index, attendance in enumerate(attendances_post_formatting, 1):
+            # Large batches are pure CPU work, so yield to the hub periodically
+            # to let the other devices' network operations progress
+            if index % FORMAT_YIELD_INTERVAL == 0:
+                eventlet.sleep(0)
             attendance.set_id(id)
             attendance.format_attendance()
-            if attendance.is_three_months_old() or attendance.is_in_the_future():
+            timestamp: datetime = attendance.timestamp
+            if timestamp and (timestamp <= three_months_ago or timestamp > now):
                 #BaseError(2003, attendance, level="warning")
                 attendance_with_error.append(attendance)
-            attendances_post_formatting.append(attendance)
-        if len(attendance_with_error) > 0:
-            return attendances_post_formatting, attendance_with_error
-        else:
-            return attendances_post_formatting, []
+        return attendances_post_formatting, attendance_with_error
 
     def manage_individual_attendances(self, device: Device, attendances: list[Attendance]):
         """
@@ -129,8 +164,9 @@ class AttendancesManagerBase(OperationManager):
         Functionality:
             - Creates a folder path based on the device's district name, model name, and point.
             - Generates a file name using the device's IP address and the current date.
-            - Saves the attendance records to the generated folder path and file name.
-            - Creates a backup folder path in the "ProgramData" directory and saves the attendance records there as well.
+            - Serializes the attendance records once and saves them to the generated folder path and file name.
+            - Creates a backup folder path in the "ProgramData" directory and appends the same serialized records
+              to the backup file, so records that only exist in the backup are preserved.
             - Handles any exceptions that occur during the process and logs them as critical errors.
 
         Raises:
@@ -139,13 +175,14 @@ class AttendancesManagerBase(OperationManager):
         """
         try:
             # logging.debug(str(device))
-            folder_path: str = create_folder_and_return_path('devices', device.district_name, device.model_name + "-" + device.point)
-            new_time: datetime = datetime.today().date()
-            date_string: str = new_time.strftime("%Y-%m-%d")
+            device_folder: str = device.model_name + "-" + device.point
+            folder_path: str = create_folder_and_return_path('devices', device.district_name, device_folder)
+            date_string: str = self.date_string or datetime.today().strftime(DATE_FORMAT)
             file_name: str = device.ip + '_' + date_string + '_file.cro'
-            self.manage_attendance_saving(attendances, folder_path, file_name)
-            program_data_path = create_folder_and_return_path(device.district_name, device.model_name + "-" + device.point, destination_path=r"C:\\ProgramData\\Gestor Reloj de Asistencias Backup\\devices")
-            self.manage_attendance_saving(attendances, program_data_path, file_name)
+            payload: bytes = self.serialize_attendances(attendances)
+            self.manage_attendance_saving(attendances, folder_path, file_name, payload=payload)
+            program_data_path = create_folder_and_return_path(device.district_name, device_folder, destination_path=BACKUP_DEVICES_PATH)
+            self.manage_attendance_saving(attendances, program_data_path, file_name, payload=payload)
         except Exception as e:
             BaseError(3000, str(e), level="critical")
 
@@ -163,16 +200,20 @@ class AttendancesManagerBase(OperationManager):
         Notes:
             - The method determines the root directory and constructs the file path
               using the `name_attendances_file` attribute.
+            - When `compress_attendances` is enabled, the records are appended to a ".txt.gz" file
+              as a new gzip member, which readers decompress as one continuous stream.
             - The actual saving of attendance data is delegated to the `manage_attendance_saving` method.
         """
         try:
             folder_path: str = find_root_directory()
             file_name: str = f"{self.name_attendances_file}.txt"
-            self.manage_attendance_saving(attendances, folder_path, file_name)
+            if self.compress_attendances:
+                file_name += ".gz"
+            self.manage_attendance_saving(attendances, folder_path, file_name, compress=self.compress_attendances)
         except Exception as e:
             BaseError(3000, str(e), level="critical")
 
-    def manage_attendance_saving(self, attendances: list[Attendance], folder_path: string, file_name: string):
+    def manage_attendance_saving(self, attendances: list[Attendance], folder_path: string, file_name: string, compress: bool = False, payload: bytes = None):
         """
         Manages the saving of attendance records to a specified file.
 
@@ -184,6 +225,8 @@ class AttendancesManagerBase(OperationManager):
             attendances (list[Attendance]): A list of attendance records to be saved.
             folder_path (str): The path to the folder where the file will be saved.
             file_name (str): The name of the file where the attendance records will be saved.
+            compress (bool, optional): Whether the records are appended gzip-compressed. Defaults to False.
+            payload (bytes, optional): The already serialized attendance records. Defaults to None.
 
         Raises:
             BaseError: If an exception occurs during the saving process, a BaseError is raised
@@ -192,17 +235,38 @@ class AttendancesManagerBase(OperationManager):
         try:
             destiny_path: str = os.path.join(folder_path, file_name)
             # logging.debug(f'destiny_path: {destiny_path}')
-            self.save_attendances_to_file(attendances, destiny_path)
+            self.save_attendances_to_file(attendances, destiny_path, compress=compress, payload=payload)
         except Exception as e:
             BaseError(3001, str(e), level="critical")
 
-    def save_attendances_to_file(self, attendances: list[Attendance], file):
+    def serialize_attendances(self, attendances: list[Attendance]):
+        """
+        Serializes a list of attendance records into the bytes written to the attendance files.
+
+        Each record is rendered as "user_id timestamp id status", with lines ending in `os.linesep`
+        and encoded with the locale encoding, matching what a text-mode write would produce.
+
+        Args:
+            attendances (list[Attendance]): A list of Attendance objects to be serialized.
+
+        Returns:
+            (bytes): The serialized attendance records.
+        """
+        return "".join(
+            f"{attendance.user_id} {attendance.timestamp_str} {attendance.id} {attendance.status}{os.linesep}"
+            for attendance in attendances
+        ).encode(locale.getpreferredencoding(False))
+
+    def save_attendances_to_file(self, attendances: list[Attendance], file, compress: bool = False, payload: bytes = None):
         """
         Saves a list of attendance records to a specified file.
 
         Args:
             attendances (list[Attendance]): A list of Attendance objects to be saved.
             file (str): The file path where the attendance records will be appended.
+            compress (bool, optional): Whether the records are appended as a gzip member. Defaults to False.
+            payload (bytes, optional): The already serialized attendance records. Defaults to None,
+                                       in which case `attendances` is serialized here.
 
         Raises:
             FileNotFoundError: If the specified file does not exist.
@@ -210,11 +274,22 @@ class AttendancesManagerBase(OperationManager):
             OSError: If an OS-related error occurs during file operations.
             Exception: For any other unexpected errors.
         """
-        with lock:
+        # Build the whole payload outside the lock so only the write is serialized
+        if payload is None:
+            payload = self.serialize_attendances(attendances)
+        if compress:
+            payload = gzip.compress(payload, compresslevel=1)
+        with get_file_lock(file):
             try:
-                with open(file, 'a') as f:
-                    for attendance in attendances:
-                        f.write(f"{attendance.user_id} {attendance.timestamp_str} {attendance.id} {attendance.status}\n")
+                # The payload is already fully built, so skip the buffered file object and append it
+                # directly. O_BINARY keeps Windows from translating the line endings a second time.
+                fd: int = os.open(file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
             except (FileNotFoundError, PermissionError, OSError) as e:
                 raise e
             except Exception as e:
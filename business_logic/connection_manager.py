@@ -17,22 +17,121 @@
 
 import re
 import logging
-import os
+import socket
+import struct
 from datetime import datetime
 import time
 import random
 from typing import Callable
 
 import eventlet
-from .types import DeviceInfo
+from eventlet.timeout import Timeout
+from .types import DeviceInfo, NetworkConfig
 from .models.attendance import Attendance
+from .connection_pool import connection_pool
+from .device_manager import update_device_field
+from .green_pool import run_parallel
 from ..connection.zk.base import ZK, ZK_helper
-import configparser
 from ..utils.errors import AttendanceMismatchError, BaseError, NetworkError, ObtainAttendancesError, OutdatedTimeError
-from ..utils.file_manager import find_root_directory
+from ..utils.file_manager import load_config
+
+# Known connection error texts, in order of precedence, and the message reported for each one
+CONNECTION_ERRORS: dict[str, str] = {
+    "TCP packet invalid": "Error de paquete TCP invalido",
+    "timed out": "Error de tiempo de espera agotado",
+    "[WinError 10040]": "Error de recepcion/envio del mensaje",
+    "unpack": "Error de recepcion/envio del mensaje",
+    "[WinError 10057]": "Dispositivo no conectado",
+    "[WinError 10035]": "Dispositivo no conectado",
+    "Instance is not connected.": "Dispositivo no conectado",
+}
+CONNECTION_ERRORS_PRIORITY: dict[str, int] = {text: index for index, text in enumerate(CONNECTION_ERRORS)}
+CONNECTION_ERRORS_PATTERN = re.compile("|".join(re.escape(text) for text in CONNECTION_ERRORS))
+# Messages reported for the exception types and Windows socket error codes that are recognized
+# without looking at the error text
+CONNECTION_ERROR_TYPES: dict[type, str] = {
+    socket.timeout: "Error de tiempo de espera agotado",
+    struct.error: "Error de recepcion/envio del mensaje",
+}
+CONNECTION_ERROR_WINERRORS: dict[int, str] = {
+    10040: "Error de recepcion/envio del mensaje",
+    10057: "Dispositivo no conectado",
+    10035: "Dispositivo no conectado",
+}
+
+class DeviceNameTable(dict):
+    """
+    Translation table for `str.translate` that keeps ASCII letters and digits, whitespace,
+    slashes and hyphens, and removes every other character. Each character is classified
+    the first time it is seen and the result is stored in the table.
+    """
+    def __missing__(self, code: int):
+        char: str = chr(code)
+        value = code if (char.isascii() and char.isalnum()) or char.isspace() or char in '/-' else None
+        self[code] = value
+        return value
+
+# Removes the characters that are not allowed from the names reported by the devices
+DEVICE_NAME_TABLE = DeviceNameTable()
+
+# Seconds a ping result is reused for the same device
+PING_CACHE_TTL: float = 2
+ping_cache: dict[tuple[str, int], tuple[float, bool]] = {}
+
+# Device information read one command at a time: (DeviceInfo key, ZK method, description)
+DEVICE_INFO_OPERATIONS: tuple = (
+    ("platform", "get_platform", "Platform"),
+    ("device_name", "get_device_name", "Device name"),
+    ("firmware_version", "get_firmware_version", "Firmware version"),
+    ("serial_number", "get_serialnumber", "Serial number"),
+)
+
+# Parsed Network_config values, together with the configuration they were parsed from
+network_config_cache: tuple = (None, None)
+
+def load_network_config():
+    """
+    Retrieves the values of the `Network_config` section of `config.ini`, already converted
+    to their types. The values are parsed again only when `load_config` returns a different
+    configuration, that is, when `config.ini` has been modified.
+
+    Returns:
+        (NetworkConfig): The parsed network configuration.
+    """
+    global network_config_cache
+    config = load_config()
+    cached_config, network_config = network_config_cache
+    if cached_config is not config:
+        network_config = NetworkConfig(
+            timeout=int(config['Network_config']['timeout']),
+            retry_connection=int(config['Network_config']['retry_connection']),
+            size_ping_test_connection=config['Network_config']['size_ping_test_connection'],
+            ping_before_retry=config.getboolean('Network_config', 'ping_before_retry', fallback=False),
+            connect_timeout=config.getfloat('Network_config', 'connect_timeout',
+                                            fallback=int(config['Network_config']['timeout']) + 5),
+        )
+        network_config_cache = (config, network_config)
+    return network_config
+
+def fleet_obtain_device_info(connection_managers: list, concurrency: int = None):
+    """
+    Obtains the information of several devices concurrently. The operations on each device
+    remain sequential, but the devices are processed in parallel using a bounded green thread pool.
+
+    Args:
+        connection_managers (list[ConnectionManager]): The connection managers of the devices, already
+            connected to them.
+        concurrency (int, optional): The maximum number of devices processed at the same time.
+            Defaults to the `threads_pool_max_size` value of the `Cpu_config` section in `config.ini`.
+
+    Returns:
+        (list[DeviceInfo]): The information of each device, in the same order as `connection_managers`.
+    """
+    return run_parallel(connection_managers, ConnectionManager.obtain_device_info, concurrency)
 
 class ConnectionManager():
-    conn = None
+    __slots__ = ('conn', 'force_udp', 'timeout', 'zk', 'ip', 'port', 'max_attempts',
+                 'size_ping_test_connection', 'ping_before_retry', 'connect_timeout', 'reused_connection', 'ping_helper')
 
     def __init__(self, ip: str, port: int, communication: str):
         """
@@ -44,39 +143,59 @@ class ConnectionManager():
             communication (str): The communication protocol to use ('UDP' or other).
 
         Attributes:
+            conn (ZK): The current connection to the device, or None if not connected.
             force_udp (bool): Indicates whether to force UDP communication.
-            config (ConfigParser): Configuration parser for reading settings from 'config.ini'.
             timeout (int): Timeout value for the connection, read from the configuration file.
-            zk (ZK): Instance of the ZK class for managing the connection.
+            zk (ZK): Instance of the ZK class owned by the manager for opening new connections. It is set
+                to None once handed over to the connection pool, and recreated on the next connection.
             ip (str): The IP address of the device.
             port (str): The port number of the device.
             max_attempts (int): Maximum number of retry attempts for the connection, read from the configuration file.
-            lock (Semaphore): Semaphore lock to manage concurrent access.
-        """
+            size_ping_test_connection (str): The size of the ping test connection, read from the configuration file.
+            ping_before_retry (bool): Whether an unreachable device is detected with a ping before retrying
+                the connection, read from the optional `ping_before_retry` key of the configuration file.
+                Defaults to False.
+            connect_timeout (float): Maximum seconds a connection attempt may take, read from the optional
+                `connect_timeout` key of the configuration file. Defaults to the timeout plus 5 seconds.
+            reused_connection (bool): Whether the current connection was taken from the connection pool.
+            ping_helper (ZK_helper): The helper used to ping the device, created on the first ping.
+        """
+        self.conn: ZK = None
         self.force_udp: bool = True if communication == 'UDP' else False
-        self.config = configparser.ConfigParser()
-        self.config.read(os.path.join(find_root_directory(), 'config.ini'))
-        self.timeout = int(self.config['Network_config']['timeout'])
-        self.zk: ZK = ZK(ip, port, timeout=self.timeout, ommit_ping=True, force_udp=self.force_udp)
+        network_config: NetworkConfig = load_network_config()
+        self.timeout = network_config.timeout
         self.ip: str = ip
         self.port: str = port
-        self.max_attempts = int(self.config['Network_config']['retry_connection'])
-        self.lock = eventlet.semaphore.Semaphore()
+        self.zk: ZK = self.__create_zk()
+        self.max_attempts = network_config.retry_connection
+        self.size_ping_test_connection: str = network_config.size_ping_test_connection
+        self.ping_before_retry: bool = network_config.ping_before_retry
+        self.connect_timeout: float = network_config.connect_timeout
+        self.reused_connection: bool = False
+        self.ping_helper: ZK_helper = None
+
+    def __create_zk(self):
+        """
+        Creates the ZK instance used to open new connections to the device.
+
+        Returns:
+            (ZK): A not yet connected ZK instance for the device.
+        """
+        return ZK(self.ip, self.port, timeout=self.timeout, ommit_ping=True, force_udp=self.force_udp)
 
     def reset_connection(self):
         """
         Resets the current connection by disconnecting and reinitializing it.
 
-        This method first disconnects the existing connection and sets the 
-        connection object to None. It then attempts to establish a new connection. 
-        If the connection attempt fails due to a ConnectionRefusedError, the 
-        exception is raised.
+        This method first closes the existing connection (without returning it to
+        the connection pool) and sets the connection object to None. It then attempts
+        to establish a new connection. If the connection attempt fails due to a
+        ConnectionRefusedError, the exception is raised.
 
         Raises:
             ConnectionRefusedError: If the connection attempt is refused.
         """
-        self.disconnect()
-        self.conn = None
+        self.__close_connection()
         try:
             self.connect()
         except ConnectionRefusedError as e:
@@ -97,16 +216,26 @@ class ConnectionManager():
         """
         Establishes a connection to the device using the provided IP address.
 
-        This method attempts to connect to the device by executing a network operation.
+        This method first tries to reuse an idle connection to the device from the connection
+        pool, which is used as `self.conn` but never kept as `self.zk`. Otherwise, it attempts to
+        connect to the device by executing a network operation, creating a new ZK instance first
+        if the previous one was handed over to the pool.
         If the connection is successful, a log message is recorded indicating the success.
         If the connection is refused, a `ConnectionRefusedError` is raised.
 
         Raises:
             ConnectionRefusedError: If the connection to the device is refused.
         """
+        self.conn = connection_pool.acquire(self.ip, self.port, self.force_udp)
+        self.reused_connection = self.conn is not None
+        if self.reused_connection:
+            logging.info(f'Reutilizando conexion al dispositivo {self.ip}')
+            return
+        if self.zk is None:
+            self.zk = self.__create_zk()
         try:
             logging.info(f'Conectando al dispositivo {self.ip}...')
-            self.conn = self.__execute_network_operation(self.zk.connect)
+            self.conn = self.__execute_network_operation(self.zk.connect, timeout=self.connect_timeout)
             logging.info(f'Conectado exitosamente al dispositivo {self.ip}')
         except ConnectionRefusedError as e:
             raise e
@@ -118,10 +247,12 @@ class ConnectionManager():
         `self.max_attempts`. If the connection fails due to a `ConnectionRefusedError`,
         it retries the connection after waiting for a period determined by an
         exponential backoff strategy. If all attempts fail, a `NetworkError` is raised.
+        After a failed attempt the device is pinged (if `ping_before_retry` is enabled),
+        and the remaining attempts are skipped if it does not respond.
 
         Raises:
             NetworkError: If the maximum number of connection attempts is reached
-                          without success.
+                          without success, or if the device does not respond to the ping.
             BaseError: If the code reaches an unreachable state (should not occur).
 
         Returns:
@@ -133,18 +264,56 @@ class ConnectionManager():
                     
                 return self.conn
             except ConnectionRefusedError as e:
-                if attempt == self.max_attempts - 1:
-                    raise NetworkError(f"Maxima cantidad de reintentos para el dispositivo {self.ip}: {str(e)}") from e
-                else:
-                    error_message = f"Intento fallido {attempt + 1}/{self.max_attempts} del dispositivo {self.ip} para la operacion de conexion: {str(e)}"
-                    NetworkError(error_message)
-                    self.__exponential_backoff(attempt)
+                self.__handle_failed_attempt(attempt, "de conexion", e, before_retry=self.__check_reachable)
         raise BaseError(0000, "Codigo inalcanzable", level="critical")
+
+    def __check_reachable(self, e: Exception):
+        """
+        Pings the device before retrying a failed connection, if `ping_before_retry` is enabled.
+
+        Args:
+            e (Exception): The error of the failed connection attempt.
+
+        Raises:
+            NetworkError: If the device does not respond to the ping.
+        """
+        if self.ping_before_retry:
+            try:
+                reachable: bool = self.ping_device()
+            except NetworkError:
+                # The ping itself could not be run, so keep retrying as usual
+                reachable = True
+            if not reachable:
+                raise NetworkError(f"El dispositivo {self.ip} no responde al ping: {str(e)}") from e
+
+    def __handle_failed_attempt(self, attempt: int, operation_name: str, e: Exception, before_retry: Callable = None):
+        """
+        Handles a failed attempt of a retried operation: raises once the maximum number of
+        attempts is reached, otherwise logs the failure and waits before the next attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt (starting from 0).
+            operation_name (str): The name of the operation, used in the log message.
+            e (Exception): The error of the failed attempt.
+            before_retry (Callable, optional): A function called with the error before waiting,
+                which may raise to stop retrying. Defaults to None.
+
+        Raises:
+            NetworkError: If the failed attempt was the last one.
+        """
+        if attempt == self.max_attempts - 1:
+            raise NetworkError(f"Maxima cantidad de reintentos para el dispositivo {self.ip}: {str(e)}") from e
+        logging.warning(f"Intento fallido {attempt + 1}/{self.max_attempts} del dispositivo {self.ip} para la operacion {operation_name}: {str(e)}")
+        if before_retry is not None:
+            before_retry(e)
+        self.__exponential_backoff(attempt)
     
     def __handle_connection_error(self, e):
         """
-        Handles connection errors by analyzing the exception message and raising a 
+        Handles connection errors by analyzing the exception and raising a 
         more specific ConnectionRefusedError with a descriptive message.
+        The exception type (`socket.timeout`, `struct.error`) and the Windows socket error
+        code are checked first; the exception message is only inspected when they do not match.
 
         Args:
             e (Exception): The exception object containing details about the connection error.
@@ -160,14 +329,19 @@ class ConnectionManager():
                   Indicates that the device is not connected.
             ConnectionRefusedError: A generic connection error if no specific case matches.
         """
-        if "TCP packet invalid" in str(e):
-            raise ConnectionRefusedError("Error de paquete TCP invalido") from e
-        elif "timed out" in str(e):
-            raise ConnectionRefusedError("Error de tiempo de espera agotado") from e
-        elif "[WinError 10040]" in str(e) or "unpack" in str(e):
-            raise ConnectionRefusedError("Error de recepcion/envio del mensaje") from e
-        elif "[WinError 10057]" in str(e) or "[WinError 10035]" in str(e) or "Instance is not connected." in str(e):
-            raise ConnectionRefusedError("Dispositivo no conectado") from e
+        for error_type, message in CONNECTION_ERROR_TYPES.items():
+            if isinstance(e, error_type):
+                raise ConnectionRefusedError(message) from e
+        if isinstance(e, OSError):
+            message: str = CONNECTION_ERROR_WINERRORS.get(getattr(e, 'winerror', None))
+            if message:
+                raise ConnectionRefusedError(message) from e
+        # The device library wraps most errors in its own exceptions, keeping only the text
+        matches: list[str] = CONNECTION_ERRORS_PATTERN.findall(str(e))
+        if matches:
+            # Keep the precedence of the table when a message matches more than one pattern
+            error_text: str = min(matches, key=CONNECTION_ERRORS_PRIORITY.get)
+            raise ConnectionRefusedError(CONNECTION_ERRORS[error_text]) from e
         logging.error(e)
         raise ConnectionRefusedError from e
     
@@ -175,9 +349,12 @@ class ConnectionManager():
         """
         Disconnects the device from the current connection.
 
-        This method attempts to disconnect the device associated with the given
-        IP address. If an exception occurs during the disconnection process,
-        it is silently ignored.
+        This method returns the connection of the device associated with the given
+        IP address to the connection pool, so later operations can reuse it. The pool
+        closes it instead if it is no longer established or pooling is disabled.
+        A connection kept by the pool belongs to it from then on, so the manager stops
+        using its ZK instance and creates a new one on the next connection.
+        If an exception occurs during the disconnection process, it is silently ignored.
 
         Logs:
             Logs an informational message indicating the disconnection attempt.
@@ -188,9 +365,59 @@ class ConnectionManager():
         """
         try:
             logging.info(f'Desconectando dispositivo {self.ip}...')
+            if connection_pool.release(self.ip, self.port, self.force_udp, self.conn) and self.conn is self.zk:
+                self.zk = None
+        except Exception as e:
+            pass
+        self.conn = None
+        self.reused_connection = False
+
+    def __close_connection(self):
+        """
+        Closes the current connection without returning it to the connection pool,
+        ignoring any error raised while disconnecting.
+        """
+        try:
             self.conn.disconnect()
         except Exception as e:
             pass
+        self.conn = None
+        self.reused_connection = False
+
+    def __enter__(self):
+        """
+        Connects to the device (or takes an idle connection from the connection pool) when
+        entering a `with` block.
+
+        Returns:
+            (ConnectionManager): The connected instance.
+
+        Raises:
+            NetworkError: If the connection cannot be established.
+        """
+        self.connect_with_retry()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Returns the connection to the connection pool when leaving a `with` block. If the block
+        failed with a connection error, the connection is closed instead, so a broken connection
+        is never reused.
+
+        Args:
+            exc_type (type): The type of the exception raised in the block, or None.
+            exc_value (Exception): The exception raised in the block, or None.
+            traceback (traceback): The traceback of the exception, or None.
+
+        Returns:
+            (bool): False, so exceptions raised in the block are propagated.
+        """
+        if self.conn is not None:
+            if exc_type is not None and issubclass(exc_type, (ConnectionRefusedError, NetworkError)):
+                self.__close_connection()
+            else:
+                self.disconnect()
+        return False
 
     def __exponential_backoff(self, attempt: int):
         """
@@ -201,15 +428,17 @@ class ConnectionManager():
 
         Behavior:
             - Calculates a wait time using an exponential backoff formula: 2^attempt + random jitter.
+              The exponent is capped at 5, so the base delay never grows past 32 seconds.
             - The random jitter is a uniform value between 0 and 3 to introduce randomness.
             - Caps the maximum wait time at 30 seconds.
-            - Pauses execution for the calculated wait time.
+            - Pauses the current green thread for the calculated wait time, letting other green threads run.
 
         Note:
             This method is intended to be used internally for managing retry delays.
         """
-        wait_time: int = min(2 ** attempt + random.uniform(0, 3), 30)
-        time.sleep(wait_time)
+        wait_time: float = min((1 << min(attempt, 5)) + random.random() * 3.0, 30.0)
+        # Yield to the hub explicitly, so other devices keep working even if time is not monkey patched
+        eventlet.sleep(wait_time)
 
     def __network_operation_wrapper(self, op: Callable, *args):
         """
@@ -217,6 +446,9 @@ class ConnectionManager():
 
         This method attempts to execute a given network operation multiple times, 
         handling connection errors and retrying with exponential backoff if necessary.
+        A connection taken from the connection pool that fails is considered stale: it is
+        closed and the operation is retried on a new connection right away, without
+        counting the failure as an attempt.
 
         Args:
             op (Callable): The network operation to be executed.
@@ -230,24 +462,29 @@ class ConnectionManager():
                           if a connection error occurs.
             BaseError: If an unreachable code path is executed (critical error).
         """
-        for attempt in range(self.max_attempts):
+        attempt: int = 0
+        while True:
             try:
                 if not self.is_connected():
                     self.reset_connection()
+                    # Operations bound to a previous connection must run on the new one
+                    if isinstance(getattr(op, '__self__', None), ZK) and op.__self__ is not self.conn:
+                        op = getattr(self.conn, op.__name__)
                 # Attempt the network operation
                 result = self.__execute_network_operation(op, *args)
                 return result
             except ConnectionRefusedError as e:
+                # A pooled connection may have been dropped by the device while idle,
+                # so discard it and retry on a fresh one without using up an attempt
+                if self.reused_connection:
+                    logging.debug(f'Descartando conexion reutilizada del dispositivo {self.ip}: {str(e)}')
+                    self.__close_connection()
+                    continue
                 # Handle connection errors and retry logic
-                if attempt == self.max_attempts - 1:
-                    raise NetworkError(f"Maxima cantidad de reintentos para el dispositivo {self.ip}: {str(e)}") from e
-                else:
-                    error_message = f"Intento fallido {attempt + 1}/{self.max_attempts} del dispositivo {self.ip} para la operacion {op.__name__}: {str(e)}"
-                    NetworkError(error_message)
-                    self.__exponential_backoff(attempt)
-        raise BaseError(0000, "Codigo inalcanzable", level="critical")
+                self.__handle_failed_attempt(attempt, op.__name__, e)
+                attempt += 1
 
-    def __execute_network_operation(self, op: callable, *args):
+    def __execute_network_operation(self, op: callable, *args, timeout: float = None):
         """
         Executes a network operation with a specified timeout and handles potential errors.
         This method wraps the execution of a callable operation (`op`) with a timeout mechanism
@@ -258,6 +495,8 @@ class ConnectionManager():
         Args:
             op (callable): The operation to execute. This should be a callable object.
             *args: Optional arguments to pass to the callable operation.
+            timeout (float, optional): Maximum seconds the operation may take. Defaults to the
+                configured `self.timeout` value plus an additional 5 seconds.
 
         Raises:
             ConnectionRefusedError: If the operation exceeds the maximum allowed time.
@@ -267,34 +506,31 @@ class ConnectionManager():
             Logs the execution time of the operation in seconds.
 
         Note:
-            The timeout is calculated as the configured `self.timeout` value plus an additional
-            5 seconds.
+            Unless given, the timeout is calculated as the configured `self.timeout` value plus
+            an additional 5 seconds.
         """
-        from eventlet.timeout import Timeout
-        timeout = self.timeout + 5
-        start_time = time.time()
+        if timeout is None:
+            timeout = self.timeout + 5
+        start_time: float = time.perf_counter()
 
         try:
             with Timeout(timeout):
-                result = op(*args) if args else op()
-                end_time = time.time()
-                return result
+                return op(*args) if args else op()
 
         except Timeout:
-            end_time = time.time()
             raise ConnectionRefusedError(
                 f"La operacion '{op.__name__}' supero el tiempo maximo de {timeout} segundos"
             )
 
         except Exception as e:
-            end_time = time.time()
             self.__handle_connection_error(e)
 
         finally:
-            elapsed_time = end_time - start_time
-            logging.debug(
-                f"{self.ip} - Tiempo de ejecucion de la operacion '{op.__name__}': {elapsed_time:.2f} segundos"
-            )
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                elapsed_time: float = time.perf_counter() - start_time
+                logging.debug(
+                    f"{self.ip} - Tiempo de ejecucion de la operacion '{op.__name__}': {elapsed_time:.2f} segundos"
+                )
 
     def obtain_device_info(self):
         """
@@ -321,7 +557,12 @@ class ConnectionManager():
             and a descriptive message.
 
         Note:
-            The "old_firmware" key is removed from the returned dictionary before it is returned.
+            The "old_firmware" key holds the same value as "firmware_version"; it is kept for
+            compatibility with existing consumers of `DeviceInfo`.
+            The caller is responsible for connecting to the device beforehand and for releasing
+            the connection afterwards. Every attribute is first read in a single operation on
+            that connection, tried only once, without retries or backoff. If it fails, each attribute
+            is read on its own (with the usual retries) so the ones that succeed are still reported.
         """
         device_info: DeviceInfo = {
             "platform": None,
@@ -333,36 +574,45 @@ class ConnectionManager():
         }
 
         try:
-            device_info["platform"] = self.__network_operation_wrapper(self.conn.get_platform)
-        except Exception as e:
-            BaseError(1000, f"{self.ip} - Error obteniendo Platform: {str(e)}")
-        try:
-            device_info["device_name"] = self.__network_operation_wrapper(self.conn.get_device_name)
-        except Exception as e:
-            BaseError(1000, f"{self.ip} - Error obteniendo Device name: {str(e)}")
-        try:
-            device_info["firmware_version"] = self.__network_operation_wrapper(self.conn.get_firmware_version)
-        except Exception as e:
-            BaseError(1000, f"{self.ip} - Error obteniendo Firmware version: {str(e)}")
-        try:
-            device_info["serial_number"] = self.__network_operation_wrapper(self.conn.get_serialnumber)
-        except Exception as e:
-            BaseError(1000, f"{self.ip} - Error obteniendo Serial number: {str(e)}")
-        try:
-            device_info["old_firmware"] = self.__network_operation_wrapper(self.conn.get_firmware_version)
+            # Every attribute is read back-to-back in a single operation, tried only once
+            (device_info["platform"], device_info["device_name"], device_info["firmware_version"],
+             device_info["serial_number"], device_info["attendance_count"]) = self.__execute_network_operation(self.__read_device_info)
         except Exception as e:
-            BaseError(1000, f"{self.ip} - Error obteniendo Old firmware: {str(e)}")
-        try:
-            device_info["attendance_count"] = self.__get_attendance_count()
-        except Exception as e:
-            BaseError(1000, f"{self.ip} - Error obteniendo Attendance count: {str(e)}")
+            logging.warning(f"{self.ip} - Error obteniendo la informacion del dispositivo en una sola operacion: {str(e)}")
+            # Fall back to reading each attribute on its own, so one failing command does not lose the rest
+            for key, operation, description in DEVICE_INFO_OPERATIONS:
+                try:
+                    device_info[key] = self.__network_operation_wrapper(getattr(self.conn, operation))
+                except Exception as e:
+                    BaseError(1000, f"{self.ip} - Error obteniendo {description}: {str(e)}")
+            try:
+                device_info["attendance_count"] = self.__get_attendance_count()
+            except Exception as e:
+                BaseError(1000, f"{self.ip} - Error obteniendo Attendance count: {str(e)}")
+        # The device has a single firmware version command, so reuse the value instead of asking again
+        device_info["old_firmware"] = device_info["firmware_version"]
 
         for key, value in device_info.items():
             logging.info(f"{self.ip} - {key}: {value}")
-            if key == "old firmware":
-                device_info.pop(key)
 
         return device_info
+
+    def __read_device_info(self):
+        """
+        Reads the platform, name, firmware version, serial number and attendance count of the
+        device on the current connection, one command after another.
+
+        Returns:
+            (tuple): The platform, device name, firmware version, serial number and attendance count.
+        """
+        conn: ZK = self.conn
+        platform: str = conn.get_platform()
+        device_name: str = conn.get_device_name()
+        firmware_version: str = conn.get_firmware_version()
+        serial_number: str = conn.get_serialnumber()
+        read_sizes: Callable = getattr(conn, 'read_sizes', None) or conn.get_attendance
+        read_sizes()
+        return platform, device_name, firmware_version, serial_number, conn.records
                             
     def update_time(self):
         """
@@ -380,12 +630,13 @@ class ConnectionManager():
         """
         try:
             zktime = self.__network_operation_wrapper(self.conn.get_time)
-            logging.debug(f'{self.ip} - Dispositivo: {zktime} - Maquina local: {datetime.today()}')
-            logging.info(f'Actualizando hora del dispositivo {self.ip}...')
             newtime = datetime.today()
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f'{self.ip} - Dispositivo: {zktime} - Maquina local: {newtime}')
+            logging.info(f'Actualizando hora del dispositivo {self.ip}...')
             self.__network_operation_wrapper(self.conn.set_time, newtime)
             logging.info(f'Validando hora del dispositivo {self.ip}...')
-            self.__validate_time(zktime)
+            self.__validate_time(zktime, newtime)
         except NetworkError as e:
             raise NetworkError(f"Error al actualizar la hora del dispositivo {self.ip}") from e
         except OutdatedTimeError as e:
@@ -393,31 +644,26 @@ class ConnectionManager():
 
         return
 
-    def __validate_time(self, zktime: datetime):
+    def __validate_time(self, zktime: datetime, newtime: datetime):
         """
-        Validates the provided datetime object against the current system time.
+        Validates the provided datetime object against the local machine's time.
 
         This method checks if the provided `zktime` is outdated by comparing it
-        to the current system time (`datetime.today()`). The validation fails if:
+        to the time that was set on the device (`newtime`). The validation fails if:
         
-        - The hour difference is greater than 0.
-        - The minute difference is 5 or more.
         - The day, month, or year do not match.
+        - The times are 5 minutes or more apart.
 
         If any of these conditions are met, an `OutdatedTimeError` is raised.
 
         Args:
             zktime (datetime): The datetime object to validate.
+            newtime (datetime): The local machine's time to compare against.
 
         Raises:
             OutdatedTimeError: If the provided `zktime` is considered outdated.
         """
-        newtime = datetime.today()
-        if (abs(zktime.hour - newtime.hour) > 0 or
-        abs(zktime.minute - newtime.minute) >= 5 or
-        zktime.day != newtime.day or
-        zktime.month != newtime.month or
-        zktime.year != newtime.year):
+        if abs((zktime - newtime).total_seconds()) >= 300 or zktime.date() != newtime.date():
             raise OutdatedTimeError()
         
     def get_attendances(self):
@@ -444,21 +690,12 @@ class ConnectionManager():
                 try:
                     logging.info(f'Obteniendo marcaciones del dispositivo {self.ip}...')
                     attendances = self.__network_operation_wrapper(self.conn.get_attendance)
-                    #logging.debug(f'{self.ip} - Obtencion de marcaciones: {attendances}')
                     records = self.conn.records
-                    logging.debug(f'{self.ip} - Longitud de marcaciones del dispositivo: {records}, Longitud de marcaciones obtenidas: {len(attendances)}')
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(f'{self.ip} - Longitud de marcaciones del dispositivo: {records}, Longitud de marcaciones obtenidas: {len(attendances)}')
                     if records != len(attendances):
                         error_message = f"Intento fallido {attempt + 1}/{self.max_attempts} del dispositivo {self.ip} para la operacion de get_attendance"
                         raise AttendanceMismatchError(error_message)
-                                    
-                    """
-                    attendances = self.__network_operation_wrapper(self.conn.get_attendance)
-                    new_records = self.conn.records
-                    logging.debug(f'{self.ip} - Longitud de marcaciones de la conexion actual: {new_records}, Longitud de marcaciones de la ultima conexion: {records}')
-                    if new_records != records:
-                        error_message = f"Intento fallido {attempt + 1}/{self.max_attempts} del dispositivo {self.ip} para la operacion de get_attendance"
-                        raise AttendanceMismatchError(error_message)
-                    """
                     break
                 except AttendanceMismatchError as e:
                     if attempt == self.max_attempts - 1:
@@ -466,29 +703,32 @@ class ConnectionManager():
                     else:
                         self.__exponential_backoff(attempt)
 
-            parsed_attendances: list[Attendance] = []
-            for attendance in attendances:
-                parsed_attendance: Attendance = Attendance(user_id=attendance.user_id,
-                                                    timestamp=attendance.timestamp,
-                                                    status=attendance.status)
-                parsed_attendances.append(parsed_attendance)
+            parsed_attendances: list[Attendance] = [Attendance.from_zk(attendance) for attendance in attendances]
             return parsed_attendances
         except (NetworkError, AttendanceMismatchError) as e:
             raise ObtainAttendancesError(self.ip) from e
         except Exception as e:
             raise BaseError(0000, str(e), level="critical") from e
         
-    def clear_attendances(self, clear_attendance: bool = False):
+    def clear_attendances(self, clear_attendance: bool = False, from_service: bool = False):
         """
         Clears attendance records from the device if the `clear_attendance` flag is set to True.
 
         Args:
-            clear_attendance (bool): A flag indicating whether to clear attendance records. 
-                                     If True, the attendance records will be cleared.
+            clear_attendance (bool, optional): A flag indicating whether to clear attendance records. 
+                                     If True, the attendance records will be cleared. If None, the flag
+                                     is read from the `Device_config` section of `config.ini`. Defaults to False.
+            from_service (bool, optional): Whether the call comes from the service. When the flag is read
+                                     from the configuration, it selects the `clear_attendance_service` key
+                                     instead of `clear_attendance`. Defaults to False.
 
         Raises:
             NetworkError: If there is an issue during the network operation to clear attendance records.
         """
+        if clear_attendance is None:
+            config_key: str = 'clear_attendance_service' if from_service else 'clear_attendance'
+            clear_attendance = load_config().getboolean('Device_config', config_key, fallback=False)
+
         if clear_attendance:
             logging.info(f'{self.ip} - Limpiando marcaciones...')
             try:
@@ -500,8 +740,10 @@ class ConnectionManager():
         """
         Retrieves the count of attendance records from the connected device.
 
-        This method uses a network operation wrapper to fetch attendance data
-        and then retrieves the total number of records from the device connection.
+        This method uses a network operation wrapper to ask the device for its record
+        counters (`read_sizes`), which is a single small command, and then retrieves the
+        total number of records from the device connection. If the connection does not
+        support `read_sizes`, it falls back to downloading the attendance data.
 
         Returns:
             (int): The total number of attendance records.
@@ -511,10 +753,11 @@ class ConnectionManager():
                           from the device.
         """
         try:
-            self.__network_operation_wrapper(self.conn.get_attendance)
-            #logging.info(f'{self.ip} - Obtencion de marcaciones: {attendances}')
+            read_sizes: Callable = getattr(self.conn, 'read_sizes', None) or self.conn.get_attendance
+            self.__network_operation_wrapper(read_sizes)
             records: int = self.conn.records
-            logging.debug(f'{self.ip} - Records: {str(records)}')
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f'{self.ip} - Records: {str(records)}')
             return records
         except NetworkError as e:
             raise NetworkError(f"Error al obtener la cantidad de marcaciones del dispositivo {self.ip}") from e
@@ -563,16 +806,21 @@ class ConnectionManager():
         Notes:
             - The method ensures that the device name contains only alphanumeric
               characters, spaces, slashes, or hyphens.
-            - The method uses a lock to ensure thread-safe access to the shared file.
+            - The name is changed in the in-memory devices table shared by all writers of the file,
+              and the file is only written (once for every change made close together) when the
+              name actually changed.
 
         Logging:
             - Logs a message when replacing the device name in the shared file.
         """
+        device_name: str = ""
+        last_error: str = ""
         try:
-            device_name: str = self.__network_operation_wrapper(self.conn.get_device_name)
-            device_name = re.sub(r'[^A-Za-z0-9\s/\-]', '', device_name)
+            device_name = self.__network_operation_wrapper(self.conn.get_device_name)
+            device_name = device_name.translate(DEVICE_NAME_TABLE)
         except NetworkError as e:
-            NetworkError(f'No se pudo obtener el nombre del dispositivo {self.ip}')
+            last_error = str(e)
+            logging.warning(f'No se pudo obtener el nombre del dispositivo {self.ip}')
         if not device_name or device_name.isspace():
             try:
                 serial_number: str = self.__network_operation_wrapper(self.conn.get_serialnumber)
@@ -580,31 +828,17 @@ class ConnectionManager():
                 if serial_number == "5235702520030":
                     device_name = "MultiBio700/ID"
             except NetworkError as e:
-                NetworkError(f'No se pudo obtener el numero de serie del dispositivo {self.ip}')
+                last_error = str(e)
+                logging.warning(f'No se pudo obtener el numero de serie del dispositivo {self.ip}')
         if not device_name or device_name.isspace():
-            raise BaseError(3000, f"Error al obtener el nombre del dispositivo {self.ip}: {str(e)}", level="warning")
+            raise BaseError(3000, f"Error al obtener el nombre del dispositivo {self.ip}: {last_error}", level="warning")
         else:
             device_name = device_name.replace(" ", "")
         
         try:
-            with open(os.path.join(find_root_directory(), 'info_devices.txt'), 'r') as file:
-                lines: list[str] = file.readlines()
-
-            new_lines: list[str] = []
-            for line in lines:
-                parts: list[str] = line.strip().split(' - ')
-
-                if parts[3] == self.ip:
-                    if parts[1] != device_name:
-                        logging.info(f'Reemplazando nombre del dispositivo {self.ip}... {parts[1]} por {device_name}')
-                        parts[1] = device_name
-                    else:
-                        return device_name
-                new_lines.append(' - '.join(parts) + '\n')
-
-            with self.lock:
-                with open(os.path.join(find_root_directory(), 'info_devices.txt'), 'w') as file:
-                    file.writelines(new_lines)
+            previous_name: str = update_device_field(self.ip, 1, device_name)
+            if previous_name is not None and previous_name != device_name:
+                logging.info(f'Reemplazando nombre del dispositivo {self.ip}... {previous_name} por {device_name}')
         except Exception as e:
             BaseError(3001, f"Error al reemplazar el nombre del dispositivo {self.ip}: {str(e)}", level="warning")
         
@@ -614,9 +848,10 @@ class ConnectionManager():
         """
         Attempts to ping the device to test network connectivity.
 
-        This method reads the network configuration from a 'config.ini' file, 
-        initializes a ZK_helper instance with the device's IP, port, and 
-        the size of the ping test connection, and performs a ping test.
+        This method reuses a ZK_helper instance with the device's IP, port, and 
+        the size of the ping test connection read from 'config.ini' at initialization,
+        and performs a ping test. Results are cached per device for `PING_CACHE_TTL`
+        seconds, so back-to-back checks on the same device do not ping it again.
 
         Returns:
             (bool): True if the ping test is successful, False otherwise.
@@ -626,10 +861,13 @@ class ConnectionManager():
                           or if any exception occurs during the ping test.
         """
         try:
-            config = configparser.ConfigParser()
-            config.read(os.path.join(find_root_directory(), 'config.ini'))
-            size_ping_test_connection: str = config['Network_config']['size_ping_test_connection']
-            zk_helper: ZK_helper = ZK_helper(self.ip, self.port, size_ping_test_connection)
-            return zk_helper.test_ping()
+            cached = ping_cache.get((self.ip, self.port))
+            if cached and time.monotonic() - cached[0] < PING_CACHE_TTL:
+                return cached[1]
+            if self.ping_helper is None:
+                self.ping_helper = ZK_helper(self.ip, self.port, self.size_ping_test_connection)
+            result: bool = self.ping_helper.test_ping()
+            ping_cache[(self.ip, self.port)] = (time.monotonic(), result)
+            return result
         except Exception as e:
             raise NetworkError(self.ip) from e
\ No newline at end of file
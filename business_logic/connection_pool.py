@@ -0,0 +1,184 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import time
+from collections import deque
+
+import eventlet
+from ..connection.zk.base import ZK
+from ..utils.file_manager import load_config
+
+class ZKPool:
+    def __init__(self, idle_timeout: float = None, max_idle_per_device: int = 1):
+        """
+        Initializes the ZKPool instance.
+
+        Args:
+            idle_timeout (float, optional): Seconds an idle connection is kept open before being closed.
+                A value of 0 disables pooling. Defaults to None, which reads `connection_pool_idle_timeout`
+                from the network configuration the first time it is needed (pooling stays disabled if
+                the option is missing).
+            max_idle_per_device (int, optional): Maximum number of idle connections kept per device. Defaults to 1.
+
+        Attributes:
+            idle_timeout (float or None): Seconds an idle connection is kept open, or None until it is read.
+            max_idle_per_device (int): Maximum number of idle connections kept per device.
+            idle_connections (dict[tuple, deque]): Idle connections keyed by (ip, port, force_udp), each stored
+                together with the moment it was released.
+            lock (eventlet.semaphore.Semaphore): A semaphore used to ensure thread-safe access to the idle connections.
+            sweeper (eventlet.greenthread.GreenThread): The greenthread that closes expired idle connections.
+        """
+        self.idle_timeout: float = idle_timeout
+        self.max_idle_per_device: int = max_idle_per_device
+        self.idle_connections: dict[tuple, deque] = {}
+        self.lock = eventlet.semaphore.Semaphore()
+        self.sweeper = None
+
+    def get_idle_timeout(self):
+        """
+        Retrieves the seconds an idle connection is kept open, reading them from the configuration
+        on the first call if they were not given to the constructor.
+
+        Returns:
+            (float): The idle timeout in seconds; 0 or less means pooling is disabled.
+        """
+        if self.idle_timeout is None:
+            self.idle_timeout = read_idle_timeout()
+        return self.idle_timeout
+
+    def acquire(self, ip: str, port: int, force_udp: bool):
+        """
+        Retrieves an already established connection to the device, if one is idle.
+
+        Args:
+            ip (str): The IP address of the device.
+            port (int): The port number of the device.
+            force_udp (bool): Whether the connection uses UDP.
+
+        Returns:
+            (ZK or None): A connected ZK instance, or None if there is no idle connection for the device.
+        """
+        idle_timeout: float = self.get_idle_timeout()
+        if idle_timeout <= 0:
+            return None
+        expired: list[ZK] = []
+        found = None
+        with self.lock:
+            connections: deque = self.idle_connections.get((ip, port, force_udp))
+            while connections:
+                conn, released_at = connections.pop()
+                if conn.is_connect and time.monotonic() - released_at < idle_timeout:
+                    found = conn
+                    break
+                expired.append(conn)
+        for conn in expired:
+            self.__close(conn)
+        return found
+
+    def release(self, ip: str, port: int, force_udp: bool, conn: ZK):
+        """
+        Returns a connection to the pool so later operations on the same device can reuse it.
+        The connection is closed instead if pooling is disabled, the connection is no longer
+        established, or the device already has the maximum number of idle connections.
+        Once pooled, the connection belongs to the pool and the caller must not use it anymore.
+
+        Args:
+            ip (str): The IP address of the device.
+            port (int): The port number of the device.
+            force_udp (bool): Whether the connection uses UDP.
+            conn (ZK): The connection to release.
+
+        Returns:
+            (bool): True if the connection was kept by the pool, False if it was closed.
+        """
+        if self.get_idle_timeout() <= 0 or not conn.is_connect:
+            self.__close(conn)
+            return False
+        with self.lock:
+            connections: deque = self.idle_connections.setdefault((ip, port, force_udp), deque())
+            pooled: bool = len(connections) < self.max_idle_per_device
+            if pooled:
+                connections.append((conn, time.monotonic()))
+                if self.sweeper is None:
+                    self.sweeper = eventlet.spawn(self.__sweep)
+        if not pooled:
+            self.__close(conn)
+        return pooled
+
+    def drain(self):
+        """
+        Closes every idle connection held by the pool.
+        """
+        with self.lock:
+            idle: list[ZK] = [conn for connections in self.idle_connections.values() for conn, _ in connections]
+            self.idle_connections.clear()
+        for conn in idle:
+            self.__close(conn)
+
+    def __sweep(self):
+        """
+        Periodically closes the idle connections that exceeded `idle_timeout`, stopping once
+        the pool is empty.
+        """
+        while True:
+            eventlet.sleep(self.idle_timeout / 2)
+            expired: list[ZK] = []
+            with self.lock:
+                now: float = time.monotonic()
+                for key in list(self.idle_connections):
+                    connections: deque = self.idle_connections[key]
+                    while connections and now - connections[0][1] >= self.idle_timeout:
+                        expired.append(connections.popleft()[0])
+                    if not connections:
+                        del self.idle_connections[key]
+                finished: bool = not self.idle_connections
+                if finished:
+                    self.sweeper = None
+            for conn in expired:
+                self.__close(conn)
+            if finished:
+                return
+
+    def __close(self, conn: ZK):
+        """
+        Closes a connection, ignoring any error raised by the device.
+
+        Args:
+            conn (ZK): The connection to close.
+        """
+        try:
+            conn.disconnect()
+        except Exception as e:
+            logging.debug(f'Error cerrando conexion inactiva: {str(e)}')
+
+def read_idle_timeout():
+    """
+    Reads `connection_pool_idle_timeout` from the network configuration.
+
+    Returns:
+        (float): The configured idle timeout in seconds, or 0 (pooling disabled) if the option
+            is missing or is not a number.
+    """
+    value: str = load_config().get('Network_config', 'connection_pool_idle_timeout', fallback='0')
+    try:
+        return float(value)
+    except ValueError:
+        logging.warning(f'Valor invalido para connection_pool_idle_timeout: {value}. Se deshabilita el pool de conexiones')
+        return 0
+
+connection_pool = ZKPool()
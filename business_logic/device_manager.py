@@ -15,14 +15,33 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import copy
 import logging
 import os
-import configparser
-config = configparser.ConfigParser()
-from ..utils.file_manager import find_root_directory, load_from_file
+from contextlib import contextmanager
+import eventlet
+from ..utils.file_manager import file_lock, get_devices_file_path, load_from_file
 from .models.device import Device
 from ..utils.errors import BaseError
 
+# Seconds to wait before writing pending changes of the devices file made during a batch,
+# so changes made close together are written at once
+DEVICES_FLUSH_DELAY: float = 1
+
+# In-memory copy of 'info_devices.txt': every line split by ' - ', and the same lines grouped
+# by IP (the same device may be listed more than once)
+devices_rows: list[list[str]] = []
+devices_table: dict[str, list[list[str]]] = {}
+devices_table_mtime: int = None
+# Changes not yet written to the file, by IP and column index
+pending_device_updates: dict[str, dict[int, str]] = {}
+flush_timer = None
+# Number of nested batches in progress; changes made outside a batch are written immediately
+devices_batch_depth: int = 0
+# Devices parsed by get_devices_info, together with the path, modification time and size of the
+# file they were read from
+devices_cache: tuple = (None, None)
+
 def organize_devices_info(line: str):
     """
     Parses a line of text containing device information and organizes it into a Device object.
@@ -35,19 +54,12 @@ def organize_devices_info(line: str):
         (Device): An instance of the Device class populated with the parsed information, or
                 None if the input line does not conform to the expected format.
     """
-    parts: list[str] = line.strip().split(" - ")
+    # A ninth part is enough to know the line has too many fields
+    parts: list[str] = line.strip().split(" - ", 8)
     if len(parts) != 8:
         return None  # Invalid format, return None
-    return Device(
-        district_name=parts[0],
-        model_name=parts[1],
-        point=parts[2],
-        ip=parts[3],
-        id=parts[4],
-        communication=parts[5],
-        battery_failing=parts[6],
-        active=parts[7]
-    )
+    # The parts are in the same order as the parameters of Device
+    return Device(*parts)
 
 def get_devices_info():
     """
@@ -55,7 +67,9 @@ def get_devices_info():
 
     This function reads device data from a file named 'info_devices.txt' located
     in the root directory of the project. It processes the data to organize
-    device information and returns a list of devices.
+    device information and returns a list of devices. The parsed devices are kept
+    and reused until the file is modified; callers receive copies of them, so changing
+    a returned device does not affect the cached ones.
 
     Returns:
         (list[str]): A list of organized device information.
@@ -65,20 +79,28 @@ def get_devices_info():
                    a BaseError with code 3001 is raised, including the error
                    message and a critical severity level.
     """
-    file_path: str = os.path.join(find_root_directory(), 'info_devices.txt')
+    global devices_cache
+    file_path: str = get_devices_file_path()
     devices: list[str] = []
     try:
-        devices = [device for data in load_from_file(file_path) if (device := organize_devices_info(data))]
+        file_stat: os.stat_result = os.stat(file_path)
+        # The size is part of the key, since a rewrite may keep the same modification time
+        file_key: tuple = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        cached_key, devices = devices_cache
+        if file_key != cached_key:
+            devices = [device for data in load_from_file(file_path) if (device := organize_devices_info(data))]
+            devices_cache = (file_key, devices)
     except Exception as e:
         raise BaseError(3001, str(e), level="critical")
-    return devices
+    return [copy.copy(device) for device in devices]
 
 def activate_all_devices():
     """
     Activates all devices by updating their status in the 'info_devices.txt' file.
-    This function reads the 'info_devices.txt' file, modifies the status of each device
-    to "True", and writes the updated information back to the file. The file is expected
-    to be located in the root directory of the project.
+    This function modifies the status of every line to "True" in the in-memory devices
+    table, including lines that share an IP address, and writes the updated information
+    back to the file in a single pass. The file is expected to be located in the root
+    directory of the project.
     
     The file format is expected to have lines where each line contains device information
     separated by ' - ', and the status is located at the 8th position (index 7).
@@ -88,18 +110,151 @@ def activate_all_devices():
                    and the exception message is raised.
     """
     try:
-        with open(os.path.join(find_root_directory(), 'info_devices.txt'), 'r') as file:
-            lines: list[str] = file.readlines()
+        with file_lock:
+            load_devices_table()
+            changed: bool = False
+            for parts in devices_rows:
+                if len(parts) > 7 and parts[7] != "True":
+                    parts[7] = "True"
+                    changed = True
+            # Written while still holding the lock, since the changes are not tracked by IP
+            if changed:
+                write_devices_table()
 
-        new_lines: list[str] = []
-        for line in lines:
-            parts: list[str] = line.strip().split(' - ')
-            parts[7] = "True"
-            new_lines.append(' - '.join(parts) + '\n')
+        logging.debug("Estado activo actualizado correctamente")
+    except Exception as e:
+        BaseError(3001, str(e))
 
-        with open(os.path.join(find_root_directory(), 'info_devices.txt'), 'w') as file:
-            file.writelines(new_lines)
+def load_devices_table():
+    """
+    Loads 'info_devices.txt' into the in-memory devices table, reading the file again only
+    when it was modified since the last load. Changes not yet written are applied again
+    over the reloaded lines, so edits made to the file by other programs are kept.
 
-        logging.debug("Estado activo actualizado correctamente")
+    Note:
+        The caller must hold `file_lock`.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    global devices_rows, devices_table, devices_table_mtime
+    file_path: str = get_devices_file_path()
+    mtime: int = os.stat(file_path).st_mtime_ns
+    if mtime == devices_table_mtime:
+        return
+
+    with open(file_path, 'r') as file:
+        devices_rows = [line.strip().split(' - ') for line in file]
+    devices_table = {}
+    for parts in devices_rows:
+        if len(parts) > 3:
+            devices_table.setdefault(parts[3], []).append(parts)
+    devices_table_mtime = mtime
+
+    for ip, updates in pending_device_updates.items():
+        for parts in devices_table.get(ip, ()):
+            for index, value in updates.items():
+                parts[index] = value
+
+@contextmanager
+def devices_batch():
+    """
+    Groups the changes of the devices table made inside a `with` block, so they are written
+    to 'info_devices.txt' at once when the outermost batch ends. Batches can be nested.
+    """
+    global devices_batch_depth
+    devices_batch_depth += 1
+    try:
+        yield
+    finally:
+        devices_batch_depth -= 1
+        if devices_batch_depth == 0:
+            flush_devices_table()
+
+def update_device_field(ip: str, index: int, value: str):
+    """
+    Changes one column of every line of a device in the in-memory devices table. Outside a
+    batch (see `devices_batch`) the change is written to the file before returning. Inside a
+    batch, `flush_devices_table` is scheduled to run after `DEVICES_FLUSH_DELAY` seconds, and
+    the batch writes whatever is still pending when it ends.
+
+    Args:
+        ip (str): The IP address of the device.
+        index (int): The position of the column in the line (for example 1 for the model name).
+        value (str): The new value of the column.
+
+    Returns:
+        (str or None): The previous value of the column, or None if the device is not in the file.
+            If the device is listed more than once, the value of the first line that changed is
+            returned, or the value of its first line if none of them changed.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    global flush_timer
+    with file_lock:
+        load_devices_table()
+        rows: list[list[str]] = devices_table.get(ip)
+        if not rows:
+            return None
+        previous: str = rows[0][index]
+        changed: bool = False
+        for parts in rows:
+            if parts[index] != value:
+                if not changed:
+                    previous = parts[index]
+                    changed = True
+                parts[index] = value
+        if not changed:
+            return previous
+        pending_device_updates.setdefault(ip, {})[index] = value
+        in_batch: bool = devices_batch_depth > 0
+        if in_batch and flush_timer is None:
+            flush_timer = eventlet.spawn_after(DEVICES_FLUSH_DELAY, flush_devices_table)
+    if not in_batch:
+        flush_devices_table()
+    return previous
+
+def flush_devices_table():
+    """
+    Writes the pending changes of the devices table to 'info_devices.txt' in a single pass.
+    The content is written to a temporary file that then replaces the original one, so readers
+    never see a partially written file. Does nothing if there are no pending changes.
+    A scheduled flush that has not run yet is cancelled, since this one writes its changes.
+    """
+    global flush_timer
+    try:
+        with file_lock:
+            if flush_timer is not None:
+                # Does nothing if the timer is the one running this flush
+                flush_timer.cancel()
+                flush_timer = None
+            if not pending_device_updates:
+                return
+            load_devices_table()
+            write_devices_table()
     except Exception as e:
-        BaseError(3001, str(e))
\ No newline at end of file
+        BaseError(3001, f"Error al guardar los cambios de los dispositivos: {str(e)}", level="warning")
+
+def write_devices_table():
+    """
+    Writes every line of the in-memory devices table to 'info_devices.txt'. The content is
+    written to a temporary file that then replaces the original one, so readers never see a
+    partially written file.
+
+    Note:
+        The caller must hold `file_lock`.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    global devices_table_mtime, devices_cache
+    file_path: str = get_devices_file_path()
+    temp_path: str = file_path + '.tmp'
+    with open(temp_path, 'w') as file:
+        file.writelines(' - '.join(parts) + '\n' for parts in devices_rows)
+    os.replace(temp_path, file_path)
+    devices_table_mtime = os.stat(file_path).st_mtime_ns
+    pending_device_updates.clear()
+    # The parsed devices are outdated even if the file kept its modification time
+    devices_cache = (None, None)
@@ -0,0 +1,58 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Callable
+import eventlet
+from ..utils.file_manager import load_config
+
+# Parsed threads_pool_max_size value, together with the configuration it was parsed from
+pool_size_cache: tuple = (None, None)
+
+def get_pool_max_size():
+    """
+    Retrieves the `threads_pool_max_size` value of the `Cpu_config` section in `config.ini`.
+    The value is parsed again only when `load_config` returns a different configuration,
+    that is, when `config.ini` has been modified.
+
+    Returns:
+        (int): The maximum number of green threads running at the same time.
+    """
+    global pool_size_cache
+    config = load_config()
+    cached_config, pool_max_size = pool_size_cache
+    if cached_config is not config:
+        pool_max_size = int(config['Cpu_config']['threads_pool_max_size'])
+        pool_size_cache = (config, pool_max_size)
+    return pool_max_size
+
+def run_parallel(devices: list, function: Callable, concurrency: int = None):
+    """
+    Runs a function over several devices concurrently using a bounded green thread pool.
+
+    Args:
+        devices (list): The items (devices, connection managers, etc.) to process.
+        function (Callable): The function to execute for each item. It receives the item as its only argument.
+        concurrency (int, optional): The maximum number of green threads running at the same time.
+            Defaults to the `threads_pool_max_size` value of the `Cpu_config` section in `config.ini`.
+
+    Returns:
+        (list): The results of the function, in the same order as `devices`.
+    """
+    if concurrency is None:
+        concurrency = get_pool_max_size()
+    pool = eventlet.GreenPool(size=concurrency)
+    return list(pool.imap(function, devices))
@@ -15,18 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import eventlet
-
-from ..utils.file_manager import find_root_directory
+from .device_manager import devices_batch, update_device_field
 from .operation_manager import OperationManager
 from .models.device import Device
 from .shared_state import SharedState
 from ..utils.errors import BaseError
 import logging
-import configparser
-config = configparser.ConfigParser()
-lock = eventlet.semaphore.Semaphore()
 
 class HourManagerBase(OperationManager):
     def __init__(self, state: SharedState):
@@ -59,20 +53,22 @@ class HourManagerBase(OperationManager):
                   
         Error Handling:
             - If a device reports a "battery failing" error, the battery status for that device
-              is updated.
+              is updated. The battery status of every device is written to the file at once.
             - Any exceptions raised during error handling are logged as warnings with a custom
               error code (3000).
         """
         self.devices_errors.clear()
         super().manage_threads_to_devices(selected_ips=selected_ips, function=self.update_device_time_of_one_device)
 
-        if len(self.devices_errors) > 0:
-            try:
-                for ip, errors in self.devices_errors.items():
-                    if errors.get("battery failing"):
+        try:
+            battery_failing_ips: set[str] = {ip for ip, errors in self.devices_errors.items() if errors.get("battery failing")}
+            if battery_failing_ips:
+                # Write the battery changes at once
+                with devices_batch():
+                    for ip in battery_failing_ips:
                         self.update_battery_status(ip)
-            except Exception as e:
-                BaseError(3000, str(e), level="warning")
+        except Exception as e:
+            BaseError(3000, str(e), level="warning")
 
         return self.devices_errors
         
@@ -82,8 +78,9 @@ class HourManagerBase(OperationManager):
     def update_battery_status(self, p_ip: str):
         """
         Updates the battery status of a device in the 'info_devices.txt' file based on its IP address.
-        This method reads the 'info_devices.txt' file, searches for the line corresponding to the given IP address,
-        and updates the battery status to "False". The updated content is then written back to the file.
+        This method looks up the device by its IP address in the in-memory devices table and updates
+        the battery status to "False". The change is written to the file together with the other
+        pending changes of the devices table.
         
         Args:
             p_ip (str): The IP address of the device whose battery status needs to be updated.
@@ -93,21 +90,7 @@ class HourManagerBase(OperationManager):
                        containing the error message.
         """
         try:
-            with open(os.path.join(find_root_directory(), 'info_devices.txt'), 'r') as file:
-                lines: list[str] = file.readlines()
-
-            new_lines: list[str] = []
-            for line in lines:
-                parts: list[str] = line.strip().split(' - ')
-                ip: str = parts[3]
-                if ip == p_ip:
-                    parts[6] = "False"
-                new_lines.append(' - '.join(parts) + '\n')
-
-            with lock:
-                with open(os.path.join(find_root_directory(), 'info_devices.txt'), 'w') as file:
-                    file.writelines(new_lines)
-
-            logging.info("Estado de pila actualizado correctamente en {}".format(p_ip))
+            if update_device_field(p_ip, 6, "False") is not None:
+                logging.info("Estado de pila actualizado correctamente en {}".format(p_ip))
         except Exception as e:
-            BaseError(3001, str(e))
\ No newline at end of file
+            BaseError(3001, str(e))
@@ -15,13 +15,45 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import calendar
 from datetime import datetime
-import os
-from dateutil.relativedelta import relativedelta
-import configparser
-config = configparser.ConfigParser()
-from ...utils.file_manager import find_root_directory
-config.read(os.path.join(find_root_directory(), 'config.ini'))
+from ...utils.file_manager import load_config
+
+def format_timestamp(timestamp: datetime):
+    """
+    Formats a timestamp as "dd/mm/YYYY HH:MM".
+
+    Equivalent to `timestamp.strftime("%d/%m/%Y %H:%M")`, but built directly from the
+    datetime fields, which is considerably faster when formatting many records.
+
+    Args:
+        timestamp (datetime): The timestamp to format.
+
+    Returns:
+        (str): The formatted timestamp.
+    """
+    return f"{timestamp.day:02d}/{timestamp.month:02d}/{timestamp.year:04d} {timestamp.hour:02d}:{timestamp.minute:02d}"
+
+def three_months_before(moment: datetime):
+    """
+    Returns the same moment three calendar months earlier. When the resulting month is
+    shorter, the day is clamped to its last day (e.g. May 31 becomes February 28 or 29).
+
+    Equivalent to `moment - relativedelta(months=3)`, without the overhead of dateutil.
+
+    Args:
+        moment (datetime): The moment to move back.
+
+    Returns:
+        (datetime): The moment three months earlier.
+    """
+    year: int = moment.year
+    month: int = moment.month - 3
+    if month < 1:
+        month += 12
+        year -= 1
+    day: int = min(moment.day, calendar.monthrange(year, month)[1])
+    return moment.replace(year=year, month=month, day=day)
 
 def load_attendance_status_config():
     """
@@ -35,13 +67,16 @@ def load_attendance_status_config():
     Global Variables:
         attendance_status_dictionary (dict): A dictionary mapping status codes
             to their respective attendance status configuration values.
+        attendance_status_list (tuple): A lookup table indexed by status code holding
+            the same values, with None for unmapped codes.
 
     Raises:
         Exception: Propagates any exception that occurs during the loading
             of the configuration.
     """
     try:
-        global attendance_status_dictionary
+        global attendance_status_dictionary, attendance_status_list
+        config = load_config()
         attendance_status_dictionary = {
             1: config['Attendance_status']['status_fingerprint'],
             15: config['Attendance_status']['status_face'],
@@ -49,12 +84,17 @@ def load_attendance_status_config():
             2: config['Attendance_status']['status_card'],
             4: config['Attendance_status']['status_card'],
         }
+        attendance_status_list = tuple(
+            attendance_status_dictionary.get(code) for code in range(max(attendance_status_dictionary) + 1)
+        )
     except Exception as e:
         raise e
     
 load_attendance_status_config()
 
 class Attendance():
+    __slots__ = ('user_id', 'timestamp', 'timestamp_str', 'id', 'status')
+
     def __init__(self, user_id = None, timestamp = None, id = None, status = None):
         """
         Initializes an instance of the attendance model.
@@ -79,12 +119,37 @@ class Attendance():
         try:
             self.user_id = user_id
             self.timestamp = timestamp
-            self.timestamp_str: str = timestamp.strftime("%d/%m/%Y %H:%M")
+            self.timestamp_str: str = format_timestamp(timestamp)
             self.id = id
             self.status = status
         except Exception as e:
             logging.error(e)
 
+    @classmethod
+    def from_zk(cls, zk_attendance):
+        """
+        Creates an Attendance from an attendance record returned by the device, assigning
+        the attributes directly instead of going through the keyword arguments of `__init__`.
+
+        Args:
+            zk_attendance (Any): The attendance record returned by the ZK connection. It must
+                                 provide `user_id`, `timestamp` and `status`.
+
+        Returns:
+            (Attendance): The created attendance, without an ID assigned.
+        """
+        try:
+            attendance: Attendance = cls.__new__(cls)
+            attendance.user_id = zk_attendance.user_id
+            attendance.timestamp = zk_attendance.timestamp
+            attendance.timestamp_str = format_timestamp(zk_attendance.timestamp)
+            attendance.id = None
+            attendance.status = zk_attendance.status
+            return attendance
+        except Exception:
+            # Let __init__ handle and log malformed records as usual
+            return cls(user_id=zk_attendance.user_id, timestamp=zk_attendance.timestamp, status=zk_attendance.status)
+
     def set_id(self, id: int):
         """
         Sets the ID for the instance.
@@ -149,32 +214,44 @@ class Attendance():
         Raises:
             ValueError: If the status code is not specified in the dictionary.
         """
-        # If the number is in the dictionary, return the transformed value
-        if number in attendance_status_dictionary:
-            return attendance_status_dictionary[number]
-        # Optional: Handle unspecified cases
-        else:
+        # Status codes are small integers, so index the lookup table directly instead of hashing
+        try:
+            value = attendance_status_list[number] if number >= 0 else None
+        except IndexError:
+            value = None
+        if value is None:
             raise ValueError(f"Unspecified status code: {number}")
+        return value
             
-    def is_three_months_old(self):
+    def is_three_months_old(self, cutoff: datetime = None):
         """
         Check if the timestamp is at least three months old.
 
-        This method compares the preformatted timestamp with the current date minus three months.
+        This method compares the timestamp with the current date minus three months.
+
+        Args:
+            cutoff (datetime, optional): The moment three months ago. Callers checking many
+                attendances can compute it once with `three_months_before(datetime.now())`.
+                Defaults to None, in which case it is computed from the current date.
         
         Returns:
             (bool): True if the timestamp is at least three months old, False otherwise.
         """
-        now = datetime.now()
-        three_months_ago = now - relativedelta(months=3)
-        return self.timestamp and self.timestamp <= three_months_ago
+        if cutoff is None:
+            cutoff = three_months_before(datetime.now())
+        return self.timestamp and self.timestamp <= cutoff
 
-    def is_in_the_future(self):
+    def is_in_the_future(self, now: datetime = None):
         """
         Check if the timestamp is in the future.
 
+        Args:
+            now (datetime, optional): The current moment. Defaults to None, in which case
+                `datetime.now()` is used.
+
         Returns:
             (bool): True if the timestamp is in the future, False otherwise.
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         return self.timestamp and self.timestamp > now
\ No newline at end of file
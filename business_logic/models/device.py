@@ -15,7 +15,28 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+TRUTHY_VALUES = frozenset({'true', '1', 'yes', 'verdadero', 'si'})
+COMMUNICATION_PROTOCOLS = frozenset({'TCP', 'UDP', 'RS232', 'RS485'})
+
+def parse_bool(value):
+    """
+    Interprets a value read from the devices file as a boolean without evaluating it as code.
+
+    Args:
+        value (str or bool): The value to interpret. Booleans are returned unchanged.
+
+    Returns:
+        (bool): True if the value is True or one of the accepted truthy strings (case-insensitive),
+              False otherwise.
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in TRUTHY_VALUES
+
 class Device:
+    __slots__ = ('district_name', 'model_name', 'point', 'ip', 'id', 'communication',
+                 'battery_failing', 'active')
+
     def __init__(self, district_name: str = None, 
                  model_name: str = None, point: str = None, 
                  ip: str = None, id: str = None, 
@@ -46,11 +67,11 @@ class Device:
         self.point: str = point
         self.ip: str = ip
         self.id: int = int(id) if id is not None else None
-        if communication not in ['TCP', 'UDP', 'RS232', 'RS485']:
+        if communication not in COMMUNICATION_PROTOCOLS:
             raise ValueError('Tipo de protocolo de comunicacion no valido "{}" en el dispositivo {}'.format(communication, ip))
         self.communication: str = communication
-        self.battery_failing: bool = battery_failing.lower() in ['true', '1', 'yes', 'verdadero', 'si']
-        self.active: bool = active.lower() in ['true', '1', 'yes', 'verdadero', 'si']
+        self.battery_failing: bool = parse_bool(battery_failing)
+        self.active: bool = parse_bool(active)
 
     def __str__(self):
         """
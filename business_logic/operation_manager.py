@@ -15,15 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import configparser
-import os
 from typing import Callable
 import eventlet
-from .device_manager import get_devices_info
+from .device_manager import devices_batch, get_devices_info
+from .green_pool import get_pool_max_size
 from .models.device import Device
 from .shared_state import SharedState
 from ..utils.errors import BaseError
-from ..utils.file_manager import find_root_directory
 
 class OperationManager:
     def __init__(self, state: SharedState):
@@ -54,17 +52,19 @@ class OperationManager:
         Raises:
             BaseError: 
                 - If there is an issue retrieving device information (error code 3001).
-                - If an exception occurs while spawning a thread for a device (error code 3000, warning level).
+                - If an exception occurs while spawning or running a thread for a device (error code 3000, warning level).
                 - If a critical exception occurs during the thread pool management (error code 0000, critical level).
         
         Notes:
             - The maximum size of the thread pool is determined by the `threads_pool_max_size` 
               value in the `config.ini` file under the `Cpu_config` section.
             - The method updates the total number of devices being processed in the state object.
+            - Nothing is read or spawned when none of the selected IPs matches a device.
+            - Changes made to the devices file while processing are written once the batch finishes.
         """
-        config = configparser.ConfigParser()
-        config.read(os.path.join(find_root_directory(), 'config.ini'))
-        pool_max_size: int = int(config['Cpu_config']['threads_pool_max_size'])
+        if not selected_ips:
+            self.state.set_total_devices(0)
+            return
 
         try:
             all_devices: list[Device] = get_devices_info()
@@ -72,19 +72,48 @@ class OperationManager:
             raise BaseError(3001, str(e))
 
         if all_devices:
-            try:
-                selected_devices: list[Device] = [device for device in all_devices if device.ip in selected_ips]
+            # Write the device changes made by the batch at once
+            with devices_batch():
+                try:
+                    selected_ip_set: frozenset[str] = frozenset(selected_ips)
+                    selected_devices: list[Device] = [device for device in all_devices if device.ip in selected_ip_set]
 
-                self.state.set_total_devices(len(selected_devices))
+                    self.state.set_total_devices(len(selected_devices))
+                    if not selected_devices:
+                        return
 
-                pool = eventlet.GreenPool(size=pool_max_size)
+                    pool = eventlet.GreenPool(size=get_pool_max_size())
+                    # Greenthreads are collected as they finish, so a slow device does not
+                    # delay handling the ones that already completed
+                    finished = eventlet.queue.LightQueue()
 
-                for selected_device in selected_devices:
-                    try:
-                        pool.spawn(function, selected_device)
-                    except Exception as e:
-                        BaseError(3000, str(e), level="warning")
+                    pending: int = 0
+                    for selected_device in selected_devices:
+                        try:
+                            green_thread = pool.spawn(function, selected_device)
+                            green_thread.link(lambda gt, device=selected_device: finished.put((device, gt)))
+                            pending += 1
+                        except Exception as e:
+                            BaseError(3000, str(e), level="warning")
+                        # Release the greenthreads that already finished while the rest are being spawned
+                        while not finished.empty():
+                            self.__handle_finished_device(*finished.get())
+                            pending -= 1
 
-                pool.waitall()
-            except Exception as e:
-                BaseError(0000, str(e), level="critical")
\ No newline at end of file
+                    for _ in range(pending):
+                        self.__handle_finished_device(*finished.get())
+                except Exception as e:
+                    BaseError(0000, str(e), level="critical")
+
+    def __handle_finished_device(self, device: Device, green_thread: eventlet.greenthread.GreenThread):
+        """
+        Collects the result of a finished device greenthread, reporting any exception it raised.
+
+        Args:
+            device (Device): The device the greenthread was processing.
+            green_thread (eventlet.greenthread.GreenThread): The finished greenthread.
+        """
+        try:
+            green_thread.wait()
+        except Exception as e:
+            BaseError(3000, f"{device.ip} - {str(e)}", level="warning")
@@ -88,6 +88,9 @@ class SharedState:
     def reset(self):
         """
         Resets the shared state by setting the count of processed devices to zero.
-        This method is typically used to reinitialize the state for a new operation.
+        This method is typically used to reinitialize the state for a new operation,
+        so the same instance (and its lock) can be reused across runs instead of
+        creating a new one each time.
         """
-        self.processed_devices = 0
\ No newline at end of file
+        with self.lock:
+            self.processed_devices = 0
\ No newline at end of file
@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import TypedDict, Optional
+from typing import NamedTuple, TypedDict, Optional
 
 class DeviceInfo(TypedDict):
     """
@@ -47,4 +47,23 @@ class ConnectionInfo(TypedDict):
             or None if no device information is available.
     """
     connection_failed: Optional[bool]
-    device_info: Optional[DeviceInfo]
\ No newline at end of file
+    device_info: Optional[DeviceInfo]
+
+class NetworkConfig(NamedTuple):
+    """
+    NetworkConfig is a NamedTuple that holds the already parsed values of the `Network_config`
+    section of `config.ini`.
+
+    Attributes:
+        timeout (int): Timeout value for the connection.
+        retry_connection (int): Maximum number of retry attempts for the connection.
+        size_ping_test_connection (str): The size of the ping test connection.
+        ping_before_retry (bool): Whether the device is pinged after a failed connection attempt,
+            so unreachable devices are not retried. Disabled unless enabled in the configuration.
+        connect_timeout (float): Maximum seconds a connection attempt may take.
+    """
+    timeout: int
+    retry_connection: int
+    size_ping_test_connection: str
+    ping_before_retry: bool
+    connect_timeout: float
\ No newline at end of file
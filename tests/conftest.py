@@ -0,0 +1,161 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import atexit
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import types
+
+import pytest
+
+# The package is meant to be imported from the application's root directory, which holds
+# 'main.py', 'config.ini', 'info_devices.txt' and 'json/errors.json'. An equivalent root is
+# built in a temporary directory so the modules resolve their files there.
+REPOSITORY_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME: str = "common"
+APPLICATION_ROOT: str = tempfile.mkdtemp(prefix="pyzktecoclocks-")
+atexit.register(shutil.rmtree, APPLICATION_ROOT, ignore_errors=True)
+
+CONFIG_INI: str = """[Network_config]
+timeout = 1
+retry_connection = 1
+size_ping_test_connection = 5
+
+[Cpu_config]
+threads_pool_max_size = 4
+
+[Program_config]
+name_attendances_file = attendances
+
+[Device_config]
+clear_attendance = True
+clear_attendance_service = False
+
+[Attendance_status]
+status_fingerprint = 1
+status_face = 15
+status_card = 0
+"""
+
+def build_application_root():
+    """
+    Creates the files the package expects in the application's root directory and makes
+    the package importable as `PACKAGE_NAME` from there.
+    """
+    with open(os.path.join(APPLICATION_ROOT, "main.py"), "w") as file:
+        file.write("")
+    with open(os.path.join(APPLICATION_ROOT, "config.ini"), "w") as file:
+        file.write(CONFIG_INI)
+    with open(os.path.join(APPLICATION_ROOT, "info_devices.txt"), "w") as file:
+        file.write("")
+    os.makedirs(os.path.join(APPLICATION_ROOT, "json"))
+    shutil.copyfile(os.path.join(REPOSITORY_ROOT, "utils", "errors.json"),
+                    os.path.join(APPLICATION_ROOT, "json", "errors.json"))
+    package_path: str = os.path.join(APPLICATION_ROOT, PACKAGE_NAME)
+    try:
+        os.symlink(REPOSITORY_ROOT, package_path, target_is_directory=True)
+    except OSError:
+        shutil.copytree(REPOSITORY_ROOT, package_path, ignore=shutil.ignore_patterns(".git", "tests", "__pycache__"))
+    sys.path.insert(0, APPLICATION_ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+build_application_root()
+
+class StubZK:
+    """
+    Stands in for `ZK` when the 'connection' submodule (pyzk) is not checked out.
+    The tests that talk to a device replace it with their own fakes.
+    """
+    def __init__(self, ip, port=4370, timeout=60, password=0, force_udp=False, ommit_ping=False, verbose=False, encoding="UTF-8"):
+        self.ip = ip
+        self.port = port
+        self.is_connect = False
+
+    def connect(self):
+        raise ConnectionRefusedError(f"No hay un dispositivo real en {self.ip}")
+
+    def disconnect(self):
+        self.is_connect = False
+
+class StubZKHelper:
+    """
+    Stands in for `ZK_helper` when the 'connection' submodule (pyzk) is not checked out.
+    """
+    def __init__(self, ip, port=4370, *args):
+        self.ip = ip
+        self.port = port
+
+    def test_ping(self, *args, **kwargs):
+        return False
+
+    def test_tcp(self, *args, **kwargs):
+        return 1
+
+def install_zk_stub():
+    """
+    Registers `StubZK` and `StubZKHelper` as `connection.zk.base` if the submodule cannot be
+    imported, so the modules that depend on it can still be tested.
+    """
+    try:
+        importlib.import_module(f"{PACKAGE_NAME}.connection.zk.base")
+        return
+    except ImportError:
+        pass
+    for name in ("connection", "connection.zk"):
+        module_name: str = f"{PACKAGE_NAME}.{name}"
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            module = types.ModuleType(module_name)
+            module.__path__ = []
+            sys.modules[module_name] = module
+    base = types.ModuleType(f"{PACKAGE_NAME}.connection.zk.base")
+    base.ZK = StubZK
+    base.ZK_helper = StubZKHelper
+    sys.modules[base.__name__] = base
+    setattr(sys.modules[f"{PACKAGE_NAME}.connection.zk"], "base", base)
+
+install_zk_stub()
+
+def load_module(name: str):
+    """
+    Imports a module of the package.
+
+    Args:
+        name (str): The dotted name of the module inside the package (e.g. "business_logic.device_manager").
+
+    Returns:
+        (module): The imported module.
+    """
+    return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+@pytest.fixture
+def package():
+    """
+    Provides `load_module` to the tests.
+    """
+    return load_module
+
+@pytest.fixture
+def application_root():
+    """
+    Provides the path of the temporary application root directory.
+    """
+    return APPLICATION_ROOT
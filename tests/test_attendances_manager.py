@@ -0,0 +1,86 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("eventlet")
+pytest.importorskip("PyQt5")
+
+def test_file_locks_do_not_grow_with_the_written_files(package, tmp_path):
+    attendances_manager = package("business_logic.attendances_manager")
+    locks = attendances_manager.file_locks
+    for day in range(1, 200):
+        attendances_manager.get_file_lock(str(tmp_path / f"10.0.0.1_2024-01-{day:03}_file.cro"))
+    assert attendances_manager.file_locks is locks
+    assert len(locks) == attendances_manager.FILE_LOCK_STRIPES
+    path = str(tmp_path / "attendances.txt")
+    assert attendances_manager.get_file_lock(path) is attendances_manager.get_file_lock(os.path.relpath(path))
+
+def create_manager(package):
+    attendances_manager = package("business_logic.attendances_manager")
+    shared_state = package("business_logic.shared_state")
+    return attendances_manager.AttendancesManagerBase(shared_state.SharedState())
+
+def create_device(package, ip):
+    Device = package("business_logic.models.device").Device
+    return Device("Distrito", "Modelo", "Punto", ip, "1", "TCP", "False", "True")
+
+def create_attendances(package, *user_ids):
+    Attendance = package("business_logic.models.attendance").Attendance
+    return [Attendance(user_id=user_id, timestamp=datetime(2024, 1, 1, 8, 0), id=1, status=1) for user_id in user_ids]
+
+def device_file_name(ip):
+    return f"{ip}_{datetime.today().strftime('%Y-%m-%d')}_file.cro"
+
+def test_individual_attendances_are_appended_to_the_backup(package, tmp_path, monkeypatch, application_root):
+    attendances_manager = package("business_logic.attendances_manager")
+    monkeypatch.setattr(attendances_manager, "BACKUP_DEVICES_PATH", str(tmp_path))
+    manager = create_manager(package)
+    device = create_device(package, "10.0.0.1")
+
+    backup_folder = tmp_path / "distrito" / "modelo-punto"
+    backup_folder.mkdir(parents=True)
+    backup_file = backup_folder / device_file_name("10.0.0.1")
+    # Records that only exist in the backup, e.g. after the primary file was moved
+    previous: bytes = b"registro previo" + os.linesep.encode()
+    backup_file.write_bytes(previous)
+
+    manager.manage_individual_attendances(device, create_attendances(package, "1"))
+
+    primary_file = os.path.join(application_root, "devices", "distrito", "modelo-punto", device_file_name("10.0.0.1"))
+    with open(primary_file, "rb") as file:
+        written: bytes = file.read()
+    assert written
+    assert backup_file.read_bytes() == previous + written
+
+def test_individual_attendances_are_appended_to_both_files(package, tmp_path, monkeypatch, application_root):
+    attendances_manager = package("business_logic.attendances_manager")
+    monkeypatch.setattr(attendances_manager, "BACKUP_DEVICES_PATH", str(tmp_path))
+    manager = create_manager(package)
+    device = create_device(package, "10.0.0.2")
+
+    manager.manage_individual_attendances(device, create_attendances(package, "1"))
+    manager.manage_individual_attendances(device, create_attendances(package, "2"))
+
+    primary_file = os.path.join(application_root, "devices", "distrito", "modelo-punto", device_file_name("10.0.0.2"))
+    with open(primary_file, "rb") as file:
+        written: bytes = file.read()
+    assert len(written.splitlines()) == 2
+    assert (tmp_path / "distrito" / "modelo-punto" / device_file_name("10.0.0.2")).read_bytes() == written
@@ -0,0 +1,107 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+pytest.importorskip("eventlet")
+pytest.importorskip("PyQt5")
+
+@pytest.fixture
+def connection_manager(package):
+    return package("business_logic.connection_manager")
+
+class FakeConnection:
+    """
+    Stands in for a connected ZK instance, counting the cleared attendance records.
+    """
+    def __init__(self):
+        self.is_connect = True
+        self.clears = 0
+
+    def clear_attendance(self):
+        self.clears += 1
+
+@pytest.fixture
+def manager(connection_manager):
+    manager = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    manager.conn = FakeConnection()
+    return manager
+
+def test_clear_attendances_does_nothing_by_default(manager):
+    # The configuration enables 'clear_attendance', but it is only read when requested
+    manager.clear_attendances()
+    assert manager.conn.clears == 0
+
+def test_clear_attendances_when_requested(manager):
+    manager.clear_attendances(True)
+    assert manager.conn.clears == 1
+
+def test_clear_attendances_reads_the_device_config(manager):
+    manager.clear_attendances(None)
+    assert manager.conn.clears == 1
+    manager.clear_attendances(None, from_service=True)
+    assert manager.conn.clears == 1
+
+class FakeDevice(FakeConnection):
+    """
+    Stands in for a connected ZK instance whose first platform request fails.
+    """
+    def __init__(self):
+        super().__init__()
+        self.platform_requests = 0
+        self.records = 42
+
+    def get_platform(self):
+        self.platform_requests += 1
+        if self.platform_requests == 1:
+            raise ConnectionRefusedError("timed out")
+        return "ZEM560"
+
+    def get_device_name(self):
+        return "K40"
+
+    def get_firmware_version(self):
+        return "Ver 6.60"
+
+    def get_serialnumber(self):
+        return "ABC123"
+
+    def read_sizes(self):
+        pass
+
+def test_obtain_device_info_tries_the_combined_read_once(connection_manager, manager, monkeypatch):
+    waits: list = []
+    monkeypatch.setattr(connection_manager.eventlet, "sleep", waits.append)
+    manager.conn = FakeDevice()
+    manager.max_attempts = 3
+
+    device_info = manager.obtain_device_info()
+
+    # The combined read fails once and every attribute is then read on its own, without waiting
+    assert manager.conn.platform_requests == 2
+    assert waits == []
+    assert device_info == {
+        "platform": "ZEM560",
+        "device_name": "K40",
+        "firmware_version": "Ver 6.60",
+        "serial_number": "ABC123",
+        "old_firmware": "Ver 6.60",
+        "attendance_count": 42,
+    }
+
+def test_ping_before_retry_is_disabled_by_default(connection_manager):
+    assert connection_manager.load_network_config().ping_before_retry is False
@@ -0,0 +1,176 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import configparser
+
+import pytest
+
+pytest.importorskip("eventlet")
+pytest.importorskip("PyQt5")
+
+@pytest.fixture
+def connection_manager(package):
+    return package("business_logic.connection_manager")
+
+class FakeZK:
+    """
+    Stands in for a ZK instance, recording every connection it opens and closes.
+    """
+    instances: list = []
+
+    def __init__(self, ip, port, timeout=60, ommit_ping=False, force_udp=False):
+        self.ip = ip
+        self.is_connect = False
+        self.connections = 0
+        self.disconnections = 0
+        self.restarts = 0
+        self.stale = False
+        FakeZK.instances.append(self)
+
+    def connect(self):
+        self.is_connect = True
+        self.stale = False
+        self.connections += 1
+        return self
+
+    def disconnect(self):
+        self.is_connect = False
+        self.disconnections += 1
+
+    def restart(self):
+        if self.stale:
+            raise ConnectionRefusedError("conexion cerrada por el dispositivo")
+        self.restarts += 1
+
+    def get_platform(self):
+        return "ZEM560"
+
+    def get_device_name(self):
+        return "K40"
+
+    def get_firmware_version(self):
+        return "Ver 6.60"
+
+    def get_serialnumber(self):
+        return "ABC123"
+
+    def read_sizes(self):
+        self.records = 0
+
+@pytest.fixture
+def pooled(connection_manager, package, monkeypatch):
+    ZKPool = package("business_logic.connection_pool").ZKPool
+    pool = ZKPool(idle_timeout=60)
+    FakeZK.instances = []
+    monkeypatch.setattr(connection_manager, "ZK", FakeZK)
+    monkeypatch.setattr(connection_manager, "connection_pool", pool)
+    yield pool
+    pool.drain()
+
+def test_pool_is_disabled_by_default(connection_manager, package):
+    connection_pool = package("business_logic.connection_pool")
+    assert connection_pool.ZKPool().get_idle_timeout() == 0
+    assert connection_pool.connection_pool.get_idle_timeout() == 0
+
+    conn = FakeZK("10.0.0.1", 4370).connect()
+    assert connection_pool.ZKPool().release("10.0.0.1", 4370, False, conn) is False
+    assert conn.disconnections == 1
+
+def test_malformed_idle_timeout_disables_the_pool(package, monkeypatch):
+    connection_pool = package("business_logic.connection_pool")
+    config = configparser.ConfigParser()
+    config.read_string("[Network_config]\nconnection_pool_idle_timeout = treinta\n")
+    monkeypatch.setattr(connection_pool, "load_config", lambda: config)
+    assert connection_pool.ZKPool().get_idle_timeout() == 0
+    # Only read when first needed, never at construction
+    assert connection_pool.ZKPool().idle_timeout is None
+
+def test_pool_hands_out_released_connections(connection_manager, package):
+    pool = package("business_logic.connection_pool").ZKPool(idle_timeout=60)
+    conn = FakeZK("10.0.0.1", 4370).connect()
+    assert pool.release("10.0.0.1", 4370, False, conn) is True
+    assert pool.acquire("10.0.0.1", 4370, True) is None
+    assert pool.acquire("10.0.0.1", 4370, False) is conn
+    assert pool.acquire("10.0.0.1", 4370, False) is None
+
+    # Only one idle connection is kept per device
+    first, second = FakeZK("10.0.0.1", 4370).connect(), FakeZK("10.0.0.1", 4370).connect()
+    assert pool.release("10.0.0.1", 4370, False, first) is True
+    assert pool.release("10.0.0.1", 4370, False, second) is False
+    assert second.disconnections == 1
+    pool.drain()
+    assert first.disconnections == 1
+
+def test_managers_never_share_a_session(connection_manager, pooled):
+    first = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    first.connect()
+    own_zk = first.conn
+    assert own_zk is first.zk
+    first.disconnect()
+    # The session now belongs to the pool
+    assert first.zk is None
+
+    second = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    second.connect()
+    assert second.reused_connection
+    assert second.conn is own_zk
+    assert second.zk is not own_zk
+
+    # While the pooled session is in use, the first manager opens a new one
+    first.connect()
+    assert first.conn is not own_zk
+    assert first.conn is first.zk
+    assert own_zk.connections == 1
+
+def test_stale_pooled_session_does_not_use_up_an_attempt(connection_manager, pooled, monkeypatch):
+    waits: list = []
+    monkeypatch.setattr(connection_manager.ConnectionManager, "_ConnectionManager__exponential_backoff",
+                        lambda self, attempt: waits.append(attempt))
+    first = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    first.connect()
+    stale = first.conn
+    first.disconnect()
+    stale.stale = True
+
+    second = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    assert second.max_attempts == 1
+    second.connect()
+    assert second.conn is stale
+    second.restart_device()
+
+    assert stale.disconnections == 1
+    assert second.conn is not stale
+    assert second.conn.restarts == 1
+    assert not second.reused_connection
+    assert waits == []
+
+def test_obtain_device_info_reads_on_the_callers_connection(connection_manager, pooled):
+    first = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    first.connect()
+    pooled_conn = first.conn
+    first.disconnect()
+
+    second = connection_manager.ConnectionManager("10.0.0.1", 4370, "TCP")
+    second.connect()
+    device_info = second.obtain_device_info()
+
+    assert device_info["platform"] == "ZEM560"
+    assert device_info["attendance_count"] == 0
+    # Every attribute is read on the pooled connection, without opening another one
+    assert second.conn is pooled_conn
+    assert len(FakeZK.instances) == 2
+    assert pooled_conn.connections == 1
@@ -0,0 +1,126 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+pytest.importorskip("eventlet")
+pytest.importorskip("PyQt5")
+
+DEVICES_LINES: list[str] = [
+    "Distrito - Modelo - Punto - 10.0.0.1 - 1 - TCP - True - True",
+    "Distrito - Modelo - Otro punto - 10.0.0.2 - 2 - UDP - True - False",
+]
+
+@pytest.fixture
+def device_manager(package, tmp_path, monkeypatch):
+    device_manager = package("business_logic.device_manager")
+    devices_file = tmp_path / "info_devices.txt"
+    devices_file.write_text("\n".join(DEVICES_LINES) + "\n")
+    monkeypatch.setattr(device_manager, "get_devices_file_path", lambda: str(devices_file))
+    monkeypatch.setattr(device_manager, "devices_rows", [])
+    monkeypatch.setattr(device_manager, "devices_table", {})
+    monkeypatch.setattr(device_manager, "devices_table_mtime", None)
+    monkeypatch.setattr(device_manager, "pending_device_updates", {})
+    monkeypatch.setattr(device_manager, "flush_timer", None)
+    monkeypatch.setattr(device_manager, "devices_batch_depth", 0)
+    monkeypatch.setattr(device_manager, "devices_cache", (None, None))
+    return device_manager
+
+def read_devices_file(device_manager):
+    with open(device_manager.get_devices_file_path()) as file:
+        return file.read().splitlines()
+
+def test_update_outside_a_batch_is_written_immediately(device_manager):
+    assert device_manager.update_device_field("10.0.0.1", 6, "False") == "True"
+    assert read_devices_file(device_manager)[0] == "Distrito - Modelo - Punto - 10.0.0.1 - 1 - TCP - False - True"
+    assert device_manager.flush_timer is None
+    assert device_manager.pending_device_updates == {}
+
+def test_update_of_an_unknown_device_changes_nothing(device_manager):
+    assert device_manager.update_device_field("10.0.0.9", 6, "False") is None
+    assert read_devices_file(device_manager) == DEVICES_LINES
+
+def test_updates_inside_a_batch_are_written_when_it_ends(device_manager):
+    with device_manager.devices_batch():
+        device_manager.update_device_field("10.0.0.1", 6, "False")
+        with device_manager.devices_batch():
+            device_manager.update_device_field("10.0.0.2", 1, "Nuevo modelo")
+        assert read_devices_file(device_manager) == DEVICES_LINES
+        assert device_manager.flush_timer is not None
+    assert read_devices_file(device_manager) == [
+        "Distrito - Modelo - Punto - 10.0.0.1 - 1 - TCP - False - True",
+        "Distrito - Nuevo modelo - Otro punto - 10.0.0.2 - 2 - UDP - True - False",
+    ]
+    # The scheduled flush is cancelled, so it does not linger after the batch
+    assert device_manager.flush_timer is None
+    assert device_manager.pending_device_updates == {}
+
+def test_update_device_field_changes_every_line_of_a_repeated_ip(device_manager):
+    with open(device_manager.get_devices_file_path(), "a") as file:
+        # A second line for an IP already in the file, already holding the new value
+        file.write("Distrito - Nuevo modelo - Repetido - 10.0.0.2 - 3 - TCP - True - False\n")
+        file.write("Distrito - Otro modelo - Repetido - 10.0.0.2 - 4 - TCP - True - False\n")
+    with device_manager.devices_batch():
+        # The value of the first line that changed is reported
+        assert device_manager.update_device_field("10.0.0.2", 1, "Nuevo modelo") == "Modelo"
+        # Pending changes are applied again to every line when the file is reloaded
+        with open(device_manager.get_devices_file_path(), "a") as file:
+            file.write("Distrito - Modelo - Agregado - 10.0.0.2 - 5 - TCP - True - False\n")
+        device_manager.devices_table_mtime = None
+    assert [line.split(" - ")[1] for line in read_devices_file(device_manager)] == [
+        "Modelo", "Nuevo modelo", "Nuevo modelo", "Nuevo modelo", "Nuevo modelo"]
+    assert device_manager.update_device_field("10.0.0.2", 1, "Nuevo modelo") == "Nuevo modelo"
+
+def test_battery_status_is_updated_on_every_line_of_a_repeated_ip(device_manager, package):
+    with open(device_manager.get_devices_file_path(), "a") as file:
+        file.write("Distrito - Modelo - Repetido - 10.0.0.1 - 3 - TCP - True - True\n")
+    state = package("business_logic.shared_state").SharedState()
+    package("business_logic.hour_manager").HourManagerBase(state).update_battery_status("10.0.0.1")
+    assert [line.split(" - ")[6] for line in read_devices_file(device_manager)] == ["False", "True", "False"]
+
+def test_activate_all_devices_activates_every_line(device_manager):
+    with open(device_manager.get_devices_file_path(), "a") as file:
+        # A second line for an IP already in the file
+        file.write("Distrito - Modelo - Repetido - 10.0.0.2 - 3 - TCP - True - False\n")
+    device_manager.activate_all_devices()
+    assert [line.rsplit(" - ", 1)[1] for line in read_devices_file(device_manager)] == ["True", "True", "True"]
+
+def test_cached_devices_are_not_shared(device_manager):
+    first = device_manager.get_devices_info()
+    first[0].point = "Cambiado"
+    second = device_manager.get_devices_info()
+    assert second[0] is not first[0]
+    assert second[0].point == "Punto"
+    assert [device.ip for device in second] == ["10.0.0.1", "10.0.0.2"]
+
+def test_rewrites_keeping_the_modification_time_are_not_missed(device_manager):
+    file_path: str = device_manager.get_devices_file_path()
+    assert [device.point for device in device_manager.get_devices_info()] == ["Punto", "Otro punto"]
+    modified_ns: int = os.stat(file_path).st_mtime_ns
+
+    # Another program rewrites the file within the same timestamp
+    with open(file_path, "w") as file:
+        file.write(DEVICES_LINES[0] + "\n")
+    os.utime(file_path, ns=(modified_ns, modified_ns))
+    assert [device.point for device in device_manager.get_devices_info()] == ["Punto"]
+
+    # A change of the same length written by the package itself
+    device_manager.update_device_field("10.0.0.1", 2, "Punta")
+    os.utime(file_path, ns=(modified_ns, modified_ns))
+    assert [device.point for device in device_manager.get_devices_info()] == ["Punta"]
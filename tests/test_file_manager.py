@@ -0,0 +1,47 @@
+# PyZKTecoClocks: GUI for managing ZKTeco clocks, enabling clock 
+# time synchronization and attendance data retrieval.
+# Copyright (C) 2024  Paulo Sebastian Spaciuk (Darukio)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+pytest.importorskip("eventlet")
+
+def test_load_config_is_shared_and_read_only(package):
+    file_manager = package("utils.file_manager")
+    config = file_manager.load_config()
+    assert file_manager.load_config() is config
+    assert config["Program_config"]["name_attendances_file"] == "attendances"
+    with pytest.raises(TypeError):
+        config["Program_config"]["name_attendances_file"] = "otro"
+    with pytest.raises(TypeError):
+        config.set("Program_config", "name_attendances_file", "otro")
+    with pytest.raises(TypeError):
+        config["Nueva_seccion"] = {}
+    with pytest.raises(TypeError):
+        del config["Program_config"]
+    assert config["Program_config"]["name_attendances_file"] == "attendances"
+
+def test_find_root_directory_caches_only_found_directories(package, monkeypatch, application_root):
+    file_manager = package("utils.file_manager")
+    monkeypatch.setattr(file_manager, "root_directory", None)
+    monkeypatch.setattr(file_manager, "find_marker_directory", lambda marker: None)
+    assert file_manager.find_root_directory() is None
+    assert file_manager.root_directory is None
+
+    monkeypatch.setattr(file_manager, "find_marker_directory", lambda marker: application_root)
+    assert file_manager.find_root_directory() == application_root
+    monkeypatch.setattr(file_manager, "find_marker_directory", lambda marker: None)
+    assert file_manager.find_root_directory() == application_root
@@ -19,6 +19,8 @@ import os
 import re
 import logging
 import sys
+import configparser
+import functools
 
 import eventlet
 file_lock = eventlet.semaphore.Semaphore()
@@ -50,6 +52,7 @@ def load_from_file(file_path):
         raise e
     return content
 
+@functools.lru_cache(maxsize=256)
 def sanitize_folder_name(name):
     """
     Sanitizes a folder name by replacing invalid characters with a hyphen ('-').
@@ -82,7 +85,8 @@ def create_folder_and_return_path(*args, destination_path=None):
 
     Notes:
         - Folder names are sanitized using the `sanitize_folder_name` function before creation.
-        - If a folder already exists, it will not be recreated.
+        - If a folder already exists, it will not be recreated. When the whole structure already
+          exists, the path is returned after a single existence check.
         - Logs a debug message for each folder that is created.
 
     Raises:
@@ -91,6 +95,11 @@ def create_folder_and_return_path(*args, destination_path=None):
     if destination_path is None:
         # Base directory where folders will be stored
         destination_path = find_root_directory()
+
+    # Fast path: a single stat when the whole structure already exists
+    final_path = os.path.join(destination_path, *(sanitize_folder_name(folder.lower()) for folder in args))
+    if os.path.isdir(final_path):
+        return final_path
     
     for folder in args:
         sanitized_folder = sanitize_folder_name(folder.lower())  # Clean the folder name
@@ -133,6 +142,9 @@ def find_marker_directory(marker, current_path=os.path.abspath(os.path.dirname(_
     
     return None
 
+# Root directory of the application, once it has been found
+root_directory: str = None
+
 def find_root_directory():
     """
     Determines the root directory of the application.
@@ -143,7 +155,15 @@ def find_root_directory():
     Returns:
         (str or None): The path to the root directory of the application, or None if the marker directory
                     cannot be found.
+
+    Notes:
+        - The result is cached, since the root directory does not change while the application runs.
+          A failed lookup is not cached, so it is attempted again on the next call.
     """
+    global root_directory
+    if root_directory is not None:
+        return root_directory
+
     path = None
     if getattr(sys, 'frozen', False):
         path = os.path.dirname(sys.executable)
@@ -151,8 +171,130 @@ def find_root_directory():
         marker = "main.py"
         path = find_marker_directory(marker)
 
+    root_directory = path
     return path
 
+class ReadOnlyConfigParser(configparser.ConfigParser):
+    """
+    A ConfigParser that rejects any change once `read_only` is set. `load_config()` shares a
+    single instance between every caller, so a change made by one of them would otherwise
+    silently affect the whole process.
+
+    Attributes:
+        read_only (bool): Whether changes are rejected.
+    """
+    read_only: bool = False
+
+    def __check_writable(self):
+        """
+        Raises:
+            TypeError: If the configuration is read-only.
+        """
+        if self.read_only:
+            raise TypeError("La configuracion compartida es de solo lectura; cree un ConfigParser propio para modificarla")
+
+    def read(self, *args, **kwargs):
+        self.__check_writable()
+        return super().read(*args, **kwargs)
+
+    def read_file(self, *args, **kwargs):
+        self.__check_writable()
+        return super().read_file(*args, **kwargs)
+
+    def read_string(self, *args, **kwargs):
+        self.__check_writable()
+        return super().read_string(*args, **kwargs)
+
+    def read_dict(self, *args, **kwargs):
+        self.__check_writable()
+        return super().read_dict(*args, **kwargs)
+
+    def add_section(self, *args, **kwargs):
+        self.__check_writable()
+        return super().add_section(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        self.__check_writable()
+        return super().set(*args, **kwargs)
+
+    def remove_option(self, *args, **kwargs):
+        self.__check_writable()
+        return super().remove_option(*args, **kwargs)
+
+    def remove_section(self, *args, **kwargs):
+        self.__check_writable()
+        return super().remove_section(*args, **kwargs)
+
+    def __setitem__(self, *args, **kwargs):
+        self.__check_writable()
+        return super().__setitem__(*args, **kwargs)
+
+    def __delitem__(self, *args, **kwargs):
+        self.__check_writable()
+        return super().__delitem__(*args, **kwargs)
+
+@functools.lru_cache(maxsize=1)
+def get_config_path():
+    """
+    Returns the path to the application's 'config.ini' file, resolved once per process.
+
+    Returns:
+        (str): The path to 'config.ini' in the root directory.
+    """
+    return os.path.join(find_root_directory(), 'config.ini')
+
+@functools.lru_cache(maxsize=1)
+def get_devices_file_path():
+    """
+    Returns the path to the application's 'info_devices.txt' file, resolved once per process.
+
+    Returns:
+        (str): The path to 'info_devices.txt' in the root directory.
+    """
+    return os.path.join(find_root_directory(), 'info_devices.txt')
+
+def load_config():
+    """
+    Reads and parses the application's 'config.ini' file located in the root directory.
+
+    The parsed configuration is cached and keyed on the file's modification time, so the
+    file is only parsed again when it changes on disk or `invalidate_config()` is called.
+    The same instance is returned to every caller, so it is read-only: callers that need
+    to change the configuration must parse their own copy.
+
+    Returns:
+        (ReadOnlyConfigParser): The parsed configuration.
+    """
+    config_path = get_config_path()
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    return _parse_config(config_path, mtime)
+
+@functools.lru_cache(maxsize=1)
+def _parse_config(config_path, mtime):
+    """
+    Parses the given configuration file. Cached by `load_config()` on the path and modification time.
+
+    Args:
+        config_path (str): The path to the configuration file.
+        mtime (int or None): The modification time of the file, used only as part of the cache key.
+
+    Returns:
+        (ReadOnlyConfigParser): The parsed configuration.
+    """
+    config = ReadOnlyConfigParser()
+    config.read(config_path)
+    config.read_only = True
+    return config
+
+def invalidate_config():
+    """
+    Clears the cached configuration so the next call to `load_config()` reads 'config.ini' again.
+    """
+    _parse_config.cache_clear()
+
 def file_exists_in_folder(file_name, folder):
     """
     Checks if a file with the specified name exists in the given folder.